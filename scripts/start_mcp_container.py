@@ -3,13 +3,28 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import os
 import sys
+from pathlib import Path
 
 
-if __name__ == "__main__":
+def main() -> int:
+    # Replace this wrapper process with the real launcher instead of calling
+    # it in-process. Every docker subprocess the launcher spawns would
+    # otherwise fork from this wrapper too, copying its page tables; exec
+    # keeps the launcher's RSS as small as possible.
     repo_root = Path(__file__).resolve().parents[1]
-    sys.path.insert(0, str(repo_root))
-    from src.mcp_container_launcher import main
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(repo_root), env.get("PYTHONPATH")) if p
+    )
+    os.execvpe(
+        sys.executable,
+        [sys.executable, "-m", "src.mcp_container_launcher", *sys.argv[1:]],
+        env,
+    )
+    return 1  # unreachable; exec does not return
 
+
+if __name__ == "__main__":
     raise SystemExit(main())
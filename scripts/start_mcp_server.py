@@ -4,11 +4,14 @@
 from __future__ import annotations
 
 from pathlib import Path
-import runpy
 import sys
 
 
 if __name__ == "__main__":
-    target = Path(__file__).with_name("start_mcp_container.py")
-    sys.argv[0] = str(target)
-    runpy.run_path(str(target), run_name="__main__")
+    # Import the sibling launcher directly instead of re-executing it via
+    # runpy.run_path: imports participate in the bytecode cache, while
+    # run_path re-reads and re-compiles the target on every invocation.
+    sys.path.insert(0, str(Path(__file__).parent))
+    from start_mcp_container import main
+
+    raise SystemExit(main())
@@ -6,6 +6,7 @@ user-defined collection system.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
@@ -17,10 +18,59 @@ from qdrant_client.models import (
     Filter,
     FieldCondition,
     MatchValue,
+    PayloadSchemaType,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
 )
 
 logger = logging.getLogger(__name__)
 
+# Payload fields that filtered searches, permission checks, and facet
+# stats select on; indexed as keywords so those lookups prune instead of
+# scanning every point
+PAYLOAD_INDEX_FIELDS = (
+    "tags",
+    "added_by",
+    "collection",
+    "category",
+    "project",
+    "pattern_type",
+)
+
+
+def ensure_payload_indexes(client: QdrantClient, name: str) -> None:
+    """Create keyword indexes for the standard payload filter fields.
+
+    Safe to call repeatedly — recreating an existing index is a no-op on
+    the server, and failures (e.g. an older Qdrant) are logged, not
+    raised, since the indexes are an optimization.
+    """
+    for field in PAYLOAD_INDEX_FIELDS:
+        try:
+            client.create_payload_index(
+                collection_name=name,
+                field_name=field,
+                field_schema=PayloadSchemaType.KEYWORD,
+            )
+        except Exception as e:
+            logger.debug(
+                "Could not index payload field %s on %s: %s", field, name, e
+            )
+
+
+def default_quantization_config() -> ScalarQuantization:
+    """Scalar quantization applied to new collections.
+
+    Qdrant keeps int8-quantized copies of the vectors in RAM for HNSW
+    traversal (4x smaller, SIMD int8 dot products) while the original
+    float32 vectors stay on disk for rescoring — no client-side changes
+    and no measurable recall loss at 384 dims.
+    """
+    return ScalarQuantization(
+        scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True)
+    )
+
 
 @dataclass
 class CollectionPermissions:
@@ -68,6 +118,9 @@ class CollectionManager:
         self.client = qdrant_client
         self.embedding_dimension = embedding_dimension
         self.collections_cache = {}  # Cache for collection metadata
+        # Known Qdrant collection names, kept in sync on create/delete so
+        # existence checks skip the get_collections round-trip
+        self._known_collections: Optional[set] = None
         self._initialize_system_collections()
 
     def _initialize_system_collections(self) -> None:
@@ -79,7 +132,8 @@ class CollectionManager:
             existing_collections = {
                 col.name for col in self.client.get_collections().collections
             }
-            
+            self._known_collections = set(existing_collections)
+
             if system_collection not in existing_collections:
                 self.client.create_collection(
                     collection_name=system_collection,
@@ -88,8 +142,9 @@ class CollectionManager:
                         distance=Distance.COSINE
                     )
                 )
+                self._known_collections.add(system_collection)
                 logger.info("✅ Created system collections metadata store")
-                
+
         except Exception as e:
             logger.error(f"❌ Failed to initialize system collections: {e}")
             raise
@@ -163,9 +218,15 @@ class CollectionManager:
                 vectors_config=VectorParams(
                     size=self.embedding_dimension,
                     distance=Distance.COSINE
-                )
+                ),
+                quantization_config=default_quantization_config()
             )
-            
+            if self._known_collections is not None:
+                self._known_collections.add(name)
+
+            # Index the standard filter fields up front
+            ensure_payload_indexes(self.client, name)
+
             # Save collection metadata
             collection_info = CollectionInfo(
                 name=name,
@@ -232,10 +293,27 @@ class CollectionManager:
                     continue
                 if owned_by and collection.metadata.created_by != owned_by:
                     continue
-                    
-                # Update stats
-                collection.stats = self._get_collection_stats(collection.name)
+
                 filtered_collections.append(collection)
+
+            # Fetch per-collection stats concurrently; each is an
+            # independent Qdrant round-trip and the client releases the
+            # GIL during network I/O, so N lookups cost ~one RTT
+            if len(filtered_collections) == 1:
+                col = filtered_collections[0]
+                col.stats = self._get_collection_stats(col.name)
+            elif filtered_collections:
+                with ThreadPoolExecutor(
+                    max_workers=min(16, len(filtered_collections))
+                ) as executor:
+                    stats_list = list(
+                        executor.map(
+                            self._get_collection_stats,
+                            [col.name for col in filtered_collections],
+                        )
+                    )
+                for col, stats in zip(filtered_collections, stats_list):
+                    col.stats = stats
             
             return {
                 "success": True,
@@ -360,7 +438,9 @@ class CollectionManager:
             
             # Delete the Qdrant collection
             self.client.delete_collection(collection_name=name)
-            
+            if self._known_collections is not None:
+                self._known_collections.discard(name)
+
             # Remove metadata
             self._delete_collection_metadata(name)
             
@@ -387,12 +467,13 @@ class CollectionManager:
         return bool(re.match(pattern, name)) and len(name) <= 100
 
     def _collection_exists(self, name: str) -> bool:
-        """Check if collection exists in Qdrant."""
+        """Check if collection exists, using the cached name set."""
         try:
-            existing_collections = {
-                col.name for col in self.client.get_collections().collections
-            }
-            return name in existing_collections
+            if self._known_collections is None:
+                self._known_collections = {
+                    col.name for col in self.client.get_collections().collections
+                }
+            return name in self._known_collections
         except Exception:
             return False
 
@@ -15,10 +15,33 @@ class Config:
     QDRANT_HOST: str = os.getenv("QDRANT_HOST", "localhost")
     QDRANT_PORT: int = int(os.getenv("QDRANT_PORT", "6333"))
     QDRANT_API_KEY: Optional[str] = os.getenv("QDRANT_API_KEY")
+    # gRPC transport is opt-in; the deployment must expose the gRPC port
+    # (the bundled launcher maps it alongside the REST port)
+    QDRANT_GRPC_PORT: int = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+    QDRANT_PREFER_GRPC: bool = (
+        os.getenv("QDRANT_PREFER_GRPC", "").lower() in {"1", "true", "yes"}
+    )
 
     # Embedding Model Configuration
     EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
     EMBEDDING_DIMENSION: int = int(os.getenv("EMBEDDING_DIMENSION", "384"))
+    # "torch" (default) or "onnx"; onnx needs optimum[onnxruntime] installed
+    EMBEDDING_BACKEND: str = os.getenv("EMBEDDING_BACKEND", "torch").lower()
+    # Torch device for the embedding model ("cuda", "cpu", ...); unset
+    # means auto-detect — use CUDA when available
+    EMBEDDING_DEVICE: Optional[str] = os.getenv("EMBEDDING_DEVICE")
+    # Token cap per input; stored memories are short, so halving the
+    # model's default 256 cuts tokenizer and attention work roughly 2x
+    EMBEDDING_MAX_SEQ_LENGTH: int = int(
+        os.getenv("EMBEDDING_MAX_SEQ_LENGTH", "128")
+    )
+    # Batch size for batched encode calls; raise on GPU to keep it fed
+    EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+    # Opt-in torch.compile for the torch backend; worthwhile for
+    # long-running servers, but the first encode pays compilation time
+    EMBEDDING_TORCH_COMPILE: bool = (
+        os.getenv("EMBEDDING_TORCH_COMPILE", "").lower() in {"1", "true", "yes"}
+    )
 
     # Memory Configuration
     DEFAULT_MEMORY_TYPE: str = "global"
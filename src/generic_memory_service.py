@@ -5,16 +5,51 @@ Provides a modern, flexible memory API that works with any user-defined
 collections instead of being locked to global/learned/agent types.
 """
 
+import asyncio
+import hashlib
+import heapq
+import itertools
 import logging
+import operator
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from qdrant_client import QdrantClient
-from qdrant_client.models import PointStruct
+from typing import Dict, List, NamedTuple, Optional, Any
+from contextlib import asynccontextmanager
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.models import Batch, OptimizersConfigDiff, PointStruct
 
 from .collection_manager import CollectionManager, CollectionPermissions
 
 logger = logging.getLogger(__name__)
 
+# Categorical tags the legacy add/search helpers pass around constantly.
+# Pre-embedding them at startup turns the common-case embed into a cache
+# hit instead of a transformer forward pass.
+KNOWN_QUERIES = (
+    "general",
+    "insight",
+    "global",
+    "learned",
+    "agent",
+)
+
+# Cosine similarity above which a past query's results are served from
+# the semantic cache without hitting Qdrant
+SEMANTIC_CACHE_THRESHOLD = 0.95
+
+
+class _LocalHit(NamedTuple):
+    """Search hit from the in-process index, shaped like a client hit."""
+
+    id: Any
+    score: float
+    payload: Dict[str, Any]
+
 
 class GenericMemoryService:
     """
@@ -29,6 +64,7 @@ class GenericMemoryService:
     def __init__(self):
         """Initialize generic memory service."""
         self.client: Optional[QdrantClient] = None
+        self.aclient: Optional[AsyncQdrantClient] = None
         self.collection_manager: Optional[CollectionManager] = None
         self.embedding_model = None
 
@@ -41,6 +77,39 @@ class GenericMemoryService:
         self.initialized = False
         self.current_user = "system"  # Current user context
 
+        # LRU cache of content hash -> embedding; repeated queries (the
+        # common chat pattern) skip the transformer forward pass entirely
+        self._embedding_cache: OrderedDict = OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
+        self._embedding_cache_capacity = 10_000
+
+        # Short-TTL cache of collection-info lookups so the existence check
+        # on every add/search stops costing a metadata round-trip
+        self._collection_info_cache: Dict[str, Any] = {}
+        self._collection_info_ttl = 30.0
+
+        # TTL'd list of collection names for untargeted search fan-out,
+        # invalidated alongside the info cache on create/delete
+        self._collection_names_cache: Optional[tuple] = None
+
+        # Current-second ISO timestamp cache; refreshed at most once per
+        # second under sustained ingest (a benign race just refreshes twice)
+        self._ts_cache: tuple = (0, "")
+
+        # Semantic query cache: recent (normalized query vector, results)
+        # pairs per search-parameter key. A near-duplicate query (cosine
+        # above SEMANTIC_CACHE_THRESHOLD) returns the cached results
+        # without any Qdrant round-trip. Flushed on every write.
+        self._query_cache: Dict[tuple, list] = {}
+        self._query_cache_lock = threading.Lock()
+        self._query_cache_capacity = 1_000
+
+        # In-process mirror of small collections: one normalized float32
+        # matrix per collection, scored with a single BLAS mat-vec instead
+        # of a Qdrant round-trip. Flushed with the query cache on writes.
+        self._local_index: Dict[str, tuple] = {}
+        self._local_index_max_points = 4_096
+
     async def initialize(self) -> Dict[str, Any]:
         """Initialize the memory service and collection manager."""
         try:
@@ -52,6 +121,12 @@ class GenericMemoryService:
 
             self.client = qdrant_manager.client
 
+            # Async client for concurrent fan-out; shares connection
+            # settings with the sync client used by the legacy paths
+            from .memory_manager import qdrant_client_kwargs
+
+            self.aclient = AsyncQdrantClient(**qdrant_client_kwargs())
+
             # Initialize collection manager
             config = Config()
             self.collection_manager = CollectionManager(
@@ -60,9 +135,19 @@ class GenericMemoryService:
             )
 
             # Initialize embedding model
-            from sentence_transformers import SentenceTransformer
+            from .memory.embedding_service import create_embedding_model
+
+            self.embedding_model = create_embedding_model("all-MiniLM-L6-v2")
 
-            self.embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
+            # Warm the embedding cache with the well-known category phrases
+            self.warmup_embedding_cache(list(KNOWN_QUERIES))
+
+            # Backfill keyword payload indexes on pre-existing collections
+            # so filtered searches and facet stats prune instead of scan
+            from .collection_manager import ensure_payload_indexes
+
+            for col in self.client.get_collections().collections:
+                ensure_payload_indexes(self.client, col.name)
 
             self.initialized = True
 
@@ -114,7 +199,7 @@ class GenericMemoryService:
                 admin=permissions.get("admin", [self.current_user]),
             )
 
-        return self.collection_manager.create_collection(
+        result = self.collection_manager.create_collection(
             name=name,
             description=description,
             tags=tags or [],
@@ -123,6 +208,8 @@ class GenericMemoryService:
             permissions=perm_obj,
             created_by=self.current_user,
         )
+        self._invalidate_collection_cache(name)
+        return result
 
     async def list_collections(
         self,
@@ -194,7 +281,7 @@ class GenericMemoryService:
         if not self._ensure_initialized():
             return {"success": False, "error": "Service not initialized"}
 
-        return self.collection_manager.update_collection(
+        result = self.collection_manager.update_collection(
             name=name,
             description=description,
             tags=tags,
@@ -202,6 +289,8 @@ class GenericMemoryService:
             project=project,
             updated_by=self.current_user,
         )
+        self._invalidate_collection_cache(name)
+        return result
 
     async def delete_collection(
         self, name: str, confirm: bool = False
@@ -210,9 +299,11 @@ class GenericMemoryService:
         if not self._ensure_initialized():
             return {"success": False, "error": "Service not initialized"}
 
-        return self.collection_manager.delete_collection(
+        result = self.collection_manager.delete_collection(
             name=name, deleted_by=self.current_user, confirm=confirm
         )
+        self._invalidate_collection_cache(name)
+        return result
 
     # Memory Content API
 
@@ -235,12 +326,51 @@ class GenericMemoryService:
         Returns:
             Success/error response with memory ID
         """
+        result = await self.add_memories_bulk(
+            collection,
+            [{"content": content, "metadata": metadata, "tags": tags}],
+        )
+        if not result.get("success"):
+            return result
+
+        return {
+            "success": True,
+            "memory_id": result["memory_ids"][0],
+            "collection": collection,
+            "message": "Memory added successfully",
+        }
+
+    async def add_memories_bulk(
+        self,
+        collection: str,
+        items: List[Dict[str, Any]],
+        wait: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Add many memories to a collection in one encode and one upsert.
+
+        Each item is a dict with a required "content" key and optional
+        "metadata" and "tags" keys. The whole batch goes through a single
+        SentenceTransformer.encode forward pass (amortizing model overhead
+        across items) and a single upsert round-trip instead of one per
+        memory.
+
+        Args:
+            collection: Collection name to add to
+            items: List of {"content", "metadata", "tags"} dicts
+
+        Returns:
+            Success/error response with the list of memory IDs
+        """
         if not self._ensure_initialized():
             return {"success": False, "error": "Service not initialized"}
 
+        if not items:
+            return {"success": False, "error": "No items provided"}
+
         try:
             # Check if collection exists and user has write permission
-            collection_info = self.collection_manager.get_collection(collection)
+            collection_info = self._get_collection_cached(collection)
             if not collection_info.get("success"):
                 return {
                     "success": False,
@@ -249,42 +379,94 @@ class GenericMemoryService:
 
             # TODO: Add permission check here
 
-            # Generate embedding
-            embedding = self._embed_text(content)
-
-            # Prepare metadata
-            full_metadata = {
-                "content": content,
-                "collection": collection,
-                "added_by": self.current_user,
-                "timestamp": datetime.now().isoformat(),
-                "tags": tags or [],
-                **(metadata or {}),
-            }
-
-            # Generate unique ID
-            content_hash = self._generate_content_hash(content)
-
-            # Create point
-            point = PointStruct(
-                id=content_hash, vector=embedding, payload=full_metadata
+            # Cache-aware batch embedding: duplicate inserts are served
+            # from the embedding LRU and only the misses go through one
+            # batched forward pass.
+            contents = [item["content"] for item in items]
+            embeddings = self._embed_texts(contents)
+
+            # One timestamp per batch; per-item clock reads add nothing
+            timestamp = self._now_iso()
+
+            memory_ids = []
+            payloads = []
+            for item in items:
+                content = item["content"]
+                memory_ids.append(self._generate_content_hash(content))
+                metadata = item.get("metadata")
+                payload = dict(metadata) if metadata else {}
+                payload["content"] = content
+                # Precomputed so stats scans never need the content bytes
+                payload["content_len"] = len(content)
+                payload["collection"] = collection
+                payload["added_by"] = self.current_user
+                payload["timestamp"] = timestamp
+                payload["tags"] = item.get("tags") or []
+                payloads.append(payload)
+
+            # Columnar Batch instead of a PointStruct per item: one pydantic
+            # model for the whole batch rather than N validated constructions,
+            # and ids/vectors/payloads serialize as parallel arrays.
+            batch = Batch(
+                ids=memory_ids,
+                vectors=embeddings.tolist(),
+                payloads=payloads,
             )
 
-            # Store in Qdrant
-            self.client.upsert(collection_name=collection, points=[point])
+            # Single upsert for the whole batch; wait=False returns as soon
+            # as the server has accepted the points, skipping the WAL-flush
+            # wait. Callers that need read-your-writes pass wait=True.
+            self.client.upsert(collection_name=collection, points=batch, wait=wait)
+            self._invalidate_query_cache()
 
-            logger.info(f"✅ Added memory to collection '{collection}'")
+            logger.info(
+                "✅ Added %d memories to collection '%s'", len(items), collection
+            )
             return {
                 "success": True,
-                "memory_id": content_hash,
+                "memory_ids": memory_ids,
                 "collection": collection,
-                "message": "Memory added successfully",
+                "count": len(items),
+                "message": f"Added {len(items)} memories to '{collection}'",
             }
 
         except Exception as e:
-            logger.error(f"❌ Failed to add memory: {e}")
+            logger.error(f"❌ Failed to add memories: {e}")
             return {"success": False, "error": str(e)}
 
+    @asynccontextmanager
+    async def bulk_ingest_context(
+        self, collection: str, restore_threshold: int = 20000
+    ):
+        """
+        Temporarily disable HNSW indexing on a collection during bulk loads.
+
+        Incremental index maintenance makes each insert slower as the
+        collection grows. Setting indexing_threshold=0 on entry lets inserts
+        skip it; restoring the threshold on exit makes Qdrant build the
+        index once over the finished data.
+
+        Usage:
+            async with service.bulk_ingest_context("docs"):
+                await service.add_memories_bulk("docs", items)
+        """
+        if not self._ensure_initialized():
+            raise RuntimeError("Service not initialized")
+
+        self.client.update_collection(
+            collection_name=collection,
+            optimizer_config=OptimizersConfigDiff(indexing_threshold=0),
+        )
+        try:
+            yield self
+        finally:
+            self.client.update_collection(
+                collection_name=collection,
+                optimizer_config=OptimizersConfigDiff(
+                    indexing_threshold=restore_threshold
+                ),
+            )
+
     async def search_memory(
         self,
         query: str,
@@ -311,68 +493,106 @@ class GenericMemoryService:
 
         try:
             # If no collections specified, search all accessible collections
+            # (name list is TTL-cached so default fan-out skips the
+            # enumeration round-trip)
             if collections is None:
-                all_collections = await self.list_collections()
-                if all_collections.get("success"):
-                    collections = [
-                        col["name"] for col in all_collections["collections"]
-                    ]
-                else:
-                    collections = []
+                collections = await self._all_collection_names()
 
             # Generate query embedding
             query_embedding = self._embed_text(query)
 
-            all_results = []
-
-            # Search each collection
-            for collection_name in collections:
-                try:
-                    # Check if collection exists
-                    collection_info = self.collection_manager.get_collection(
-                        collection_name
-                    )
-                    if not collection_info.get("success"):
-                        continue
+            # Filter to collections that exist before dispatching, so the
+            # fan-out only carries real searches
+            collections = [
+                name
+                for name in collections
+                if self._get_collection_cached(name).get("success")
+            ]
+
+            # Semantic cache: a near-duplicate of a recent query (same
+            # search parameters) skips the whole Qdrant fan-out
+            norm = float(np.linalg.norm(query_embedding))
+            query_unit = query_embedding / norm if norm else query_embedding
+            params_key = (tuple(collections), limit, min_score)
+            if filters is None:
+                cached_result = self._semantic_cache_get(params_key, query_unit)
+                if cached_result is not None:
+                    return cached_result
 
-                    # TODO: Add permission check here
-
-                    # Perform search
-                    search_results = self.client.search(
-                        collection_name=collection_name,
-                        query_vector=query_embedding,
-                        limit=limit,
-                        score_threshold=min_score,
-                    )
+            # TODO: Add permission check here
 
-                    # Process results
-                    for result in search_results:
-                        all_results.append(
-                            {
-                                "id": result.id,
-                                "score": result.score,
-                                "collection": collection_name,
-                                "payload": result.payload,
-                            }
+            # Qdrant has no cross-collection query RPC, so the fan-out is
+            # dispatched concurrently instead of one blocking round-trip per
+            # collection: wall time becomes max(collection latencies), not
+            # their sum. The async client multiplexes the requests on its
+            # own connections without tying up executor threads.
+            if self.aclient is not None:
+                outcomes = await asyncio.gather(
+                    *[
+                        self.aclient.search(
+                            collection_name=name,
+                            query_vector=query_embedding,
+                            limit=limit,
+                            score_threshold=min_score,
                         )
+                        for name in collections
+                    ],
+                    return_exceptions=True,
+                )
+            else:
+                # Async client unavailable (e.g. injected sync-only client):
+                # fall back to threaded fan-out over the sync client
+                loop = asyncio.get_running_loop()
+                outcomes = await asyncio.gather(
+                    *[
+                        loop.run_in_executor(
+                            None,
+                            lambda name=name: self.client.search(
+                                collection_name=name,
+                                query_vector=query_embedding,
+                                limit=limit,
+                                score_threshold=min_score,
+                            ),
+                        )
+                        for name in collections
+                    ],
+                    return_exceptions=True,
+                )
 
-                except Exception as e:
+            all_results = []
+            for collection_name, outcome in zip(collections, outcomes):
+                if isinstance(outcome, Exception):
                     logger.warning(
-                        f"Failed to search collection {collection_name}: {e}"
+                        f"Failed to search collection {collection_name}: {outcome}"
                     )
                     continue
 
-            # Sort by score and limit
-            all_results.sort(key=lambda x: x["score"], reverse=True)
-            all_results = all_results[:limit]
+                for result in outcome:
+                    all_results.append(
+                        {
+                            "id": result.id,
+                            "score": result.score,
+                            "collection": collection_name,
+                            "payload": result.payload,
+                        }
+                    )
 
-            return {
+            # Top-k selection: O(M log limit) heap instead of sorting all M
+            # merged results just to slice the first `limit`
+            all_results = heapq.nlargest(
+                limit, all_results, key=operator.itemgetter("score")
+            )
+
+            response = {
                 "success": True,
                 "results": all_results,
                 "query": query,
                 "collections_searched": collections,
                 "total_results": len(all_results),
             }
+            if filters is None:
+                self._semantic_cache_put(params_key, query_unit, response)
+            return response
 
         except Exception as e:
             logger.error(f"❌ Failed to search memory: {e}")
@@ -412,6 +632,7 @@ class GenericMemoryService:
             # TODO: Add permission check here
 
             self.client.delete(collection_name=collection, points_selector=[memory_id])
+            self._invalidate_query_cache()
 
             return {"success": True, "message": "Memory deleted successfully"}
 
@@ -435,29 +656,58 @@ class GenericMemoryService:
             # Get additional stats from Qdrant
             info = self.client.get_collection(collection)
 
-            # Get recent activity (last 100 memories)
-            recent_memories = self.client.scroll(
-                collection_name=collection, limit=100, with_payload=True
-            )
-
-            # Analyze tags and metadata
-            tag_counts = {}
-            content_sizes = []
-            users = set()
-
-            for point in recent_memories[0]:
-                payload = point.payload
-
-                # Count tags
-                for tag in payload.get("tags", []):
-                    tag_counts[tag] = tag_counts.get(tag, 0) + 1
-
-                # Track content size
-                content = payload.get("content", "")
-                content_sizes.append(len(content))
+            # Tag and contributor tallies: prefer the server-side facet
+            # API, which reduces inside Qdrant's core and returns a small
+            # counts map instead of shipping every payload to Python. It
+            # needs a keyword payload index on the field; without one (or
+            # on older servers) fall back to the streaming scan.
+            top_tags, total_contributors = self._facet_tag_stats(collection)
+
+            # Content sizes still need a scan, but only the precomputed
+            # content_len integer travels over the wire
+            payload_fields = ["content_len"]
+            if top_tags is None:
+                payload_fields += ["tags", "added_by"]
+
+            tag_counter: Counter = Counter()
+            users: set = set()
+            size_total = 0
+            size_count = 0
+            for points in self._iter_scroll(
+                collection, with_payload=payload_fields
+            ):
+                payloads = [point.payload for point in points]
+                # Counter.update over a chained iterator and numpy over the
+                # sizes run each batch's aggregation in C instead of
+                # per-point dict lookups in the interpreter.
+                if top_tags is None:
+                    tag_counter.update(
+                        itertools.chain.from_iterable(
+                            payload.get("tags", []) for payload in payloads
+                        )
+                    )
+                    users.update(
+                        payload.get("added_by", "unknown")
+                        for payload in payloads
+                    )
+                # content_len only exists on points written since it was
+                # introduced; the projection excludes raw content, so older
+                # points are left out of the average rather than dragging
+                # it toward zero
+                sizes = np.fromiter(
+                    (
+                        payload["content_len"]
+                        for payload in payloads
+                        if "content_len" in payload
+                    ),
+                    dtype=np.int64,
+                )
+                size_total += int(sizes.sum())
+                size_count += sizes.size
 
-                # Track users
-                users.add(payload.get("added_by", "unknown"))
+            if top_tags is None:
+                top_tags = tag_counter.most_common(10)
+                total_contributors = len(users)
 
             stats = {
                 "success": True,
@@ -469,12 +719,10 @@ class GenericMemoryService:
                 },
                 "content_analysis": {
                     "avg_content_size": (
-                        sum(content_sizes) / len(content_sizes) if content_sizes else 0
+                        size_total / size_count if size_count else 0
                     ),
-                    "total_contributors": len(users),
-                    "top_tags": sorted(
-                        tag_counts.items(), key=lambda x: x[1], reverse=True
-                    )[:10],
+                    "total_contributors": total_contributors,
+                    "top_tags": top_tags,
                 },
                 "metadata": collection_info["collection"],
             }
@@ -628,6 +876,85 @@ class GenericMemoryService:
             logger.error(f"❌ add_to_agent_memory failed: {e}")
             return {"success": False, "error": str(e)}
 
+    def bulk_add_legacy(
+        self,
+        collection_key: str,
+        items: List[Dict[str, Any]],
+        parallel: int = 8,
+    ) -> Dict[str, Any]:
+        """
+        Bulk-load items into one of the legacy collections.
+
+        Complements the per-call add_to_*_memory helpers for ingest jobs:
+        encodes every content in one batched forward pass, then hands the
+        vectors and payloads to client.upload_collection, which shards the
+        upload across parallel worker threads instead of one upsert per
+        memory.
+
+        Args:
+            collection_key: "global", "learned", or "agent"
+            items: List of {"content", "metadata"} dicts
+            parallel: Number of parallel upload workers
+
+        Returns:
+            Success/error response with the uploaded memory IDs
+        """
+        if not self._ensure_initialized():
+            return {"success": False, "error": "Service not initialized"}
+
+        if collection_key not in self.legacy_collections:
+            return {
+                "success": False,
+                "error": f"Unknown legacy collection key: {collection_key}",
+            }
+
+        if not items:
+            return {"success": False, "error": "No items provided"}
+
+        try:
+            collection_name = self.legacy_collections[collection_key]
+
+            contents = [item["content"] for item in items]
+            # Cache-aware: LRU hits skip the forward pass entirely
+            embeddings = self._embed_texts(contents)
+
+            timestamp = datetime.now().isoformat()
+            ids = [self._generate_content_hash(content) for content in contents]
+            payloads = [
+                {
+                    "content": item["content"],
+                    "content_len": len(item["content"]),
+                    "timestamp": timestamp,
+                    "added_by": self.current_user,
+                    **(item.get("metadata") or {}),
+                }
+                for item in items
+            ]
+
+            self.client.upload_collection(
+                collection_name=collection_name,
+                vectors=embeddings,
+                payload=payloads,
+                ids=ids,
+                parallel=parallel,
+                batch_size=1024,
+            )
+            self._invalidate_query_cache()
+
+            logger.info(
+                f"✅ Bulk-loaded {len(ids)} memories into '{collection_name}'"
+            )
+            return {
+                "success": True,
+                "memory_ids": ids,
+                "collection": collection_name,
+                "count": len(ids),
+            }
+
+        except Exception as e:
+            logger.error(f"❌ bulk_add_legacy failed: {e}")
+            return {"success": False, "error": str(e)}
+
     def query_memory(
         self,
         query: str,
@@ -770,23 +1097,306 @@ class GenericMemoryService:
             and self.embedding_model is not None
         )
 
-    def _embed_text(self, text: str) -> List[float]:
-        """Generate embedding for text."""
+    def _get_collection_cached(self, name: str) -> Dict[str, Any]:
+        """get_collection with a short TTL cache for hot-path checks."""
+        cached = self._collection_info_cache.get(name)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self._collection_info_ttl:
+            return cached[1]
+
+        info = self.collection_manager.get_collection(name)
+        # Only successful lookups are cached; a missing collection can be
+        # created at any moment and should be re-checked
+        if info.get("success"):
+            self._collection_info_cache[name] = (now, info)
+        return info
+
+    def _invalidate_collection_cache(self, name: Optional[str] = None) -> None:
+        if name is None:
+            self._collection_info_cache.clear()
+        else:
+            self._collection_info_cache.pop(name, None)
+        self._collection_names_cache = None
+
+    async def _all_collection_names(self) -> List[str]:
+        """Collection names for untargeted fan-out, cached with a short TTL."""
+        now = time.monotonic()
+        cached = self._collection_names_cache
+        if cached is not None and now - cached[0] < self._collection_info_ttl:
+            return cached[1]
+
+        all_collections = await self.list_collections()
+        if not all_collections.get("success"):
+            return []
+        names = [col["name"] for col in all_collections["collections"]]
+        self._collection_names_cache = (now, names)
+        return names
+
+    def _semantic_cache_get(
+        self, params_key: tuple, query_vec: np.ndarray
+    ) -> Optional[Dict[str, Any]]:
+        """Return cached results for a semantically near-duplicate query."""
+        with self._query_cache_lock:
+            entries = self._query_cache.get(params_key)
+            if not entries:
+                return None
+            vecs = np.vstack([vec for vec, _ in entries])
+        # Vectors are L2-normalized, so the dot product is the cosine;
+        # one matrix-vector product scores every cached query at once
+        scores = vecs @ query_vec
+        best = int(scores.argmax())
+        if scores[best] >= SEMANTIC_CACHE_THRESHOLD:
+            return entries[best][1]
+        return None
+
+    def _semantic_cache_put(
+        self, params_key: tuple, query_vec: np.ndarray, result: Dict[str, Any]
+    ) -> None:
+        with self._query_cache_lock:
+            entries = self._query_cache.setdefault(params_key, [])
+            entries.append((query_vec, result))
+            if len(entries) > self._query_cache_capacity:
+                del entries[0]
+
+    def _invalidate_query_cache(self) -> None:
+        """Drop cached search results; any write can change what a
+        query should return."""
+        with self._query_cache_lock:
+            self._query_cache.clear()
+        self._local_index.clear()
+
+    def _local_collection_index(self, name: str) -> Optional[tuple]:
+        """Mirror a small collection into a normalized float32 matrix.
+
+        Returns (matrix, ids, payloads) for collections at or below
+        _local_index_max_points, or None when the collection is too large
+        (or unreadable) — callers then search Qdrant as usual. The result,
+        including the None verdict, is cached for the collection-info TTL.
+        """
+        now = time.monotonic()
+        cached = self._local_index.get(name)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+
+        entry = None
+        try:
+            info = self.client.get_collection(name)
+            count = info.points_count or 0
+            if 0 < count <= self._local_index_max_points:
+                ids: list = []
+                payloads: list = []
+                vectors: list = []
+                for points in self._iter_scroll(
+                    name, with_payload=True, with_vectors=True
+                ):
+                    for point in points:
+                        ids.append(point.id)
+                        payloads.append(point.payload)
+                        vectors.append(point.vector)
+                matrix = np.asarray(vectors, dtype=np.float32)
+                # Normalize rows so cosine similarity reduces to one
+                # BLAS matrix-vector product at query time
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                norms[norms == 0] = 1.0
+                matrix /= norms
+                entry = (matrix, ids, payloads)
+        except Exception as e:
+            logger.debug("Local index unavailable for %s: %s", name, e)
+
+        self._local_index[name] = (now + self._collection_info_ttl, entry)
+        return entry
+
+    def _local_search(
+        self,
+        name: str,
+        query_vec: np.ndarray,
+        limit: int,
+        min_score: float,
+    ) -> Optional[List[_LocalHit]]:
+        """Score a query against the local mirror of a small collection."""
+        entry = self._local_collection_index(name)
+        if entry is None:
+            return None
+
+        matrix, ids, payloads = entry
+        norm = float(np.linalg.norm(query_vec))
+        query_unit = query_vec / norm if norm else query_vec
+        scores = matrix @ query_unit
+
+        k = min(limit, scores.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            _LocalHit(ids[i], float(scores[i]), payloads[i])
+            for i in top
+            if scores[i] >= min_score
+        ]
+
+    def _now_iso(self) -> str:
+        """ISO timestamp with second resolution, cached within the second."""
+        second = int(time.time())
+        cached_second, cached_iso = self._ts_cache
+        if second != cached_second:
+            cached_iso = datetime.now().isoformat(timespec="seconds")
+            self._ts_cache = (second, cached_iso)
+        return cached_iso
+
+    @staticmethod
+    def _embedding_cache_key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    def _facet_tag_stats(self, collection: str):
+        """Try server-side facet counts for tags and contributors.
+
+        Returns (top_tags, total_contributors), or (None, None) when the
+        facet API is unavailable or the fields lack keyword indexes —
+        callers then aggregate client-side.
+        """
+        try:
+            tag_facet = self.client.facet(
+                collection_name=collection, key="tags", limit=10
+            )
+            user_facet = self.client.facet(
+                collection_name=collection, key="added_by", limit=10_000
+            )
+            top_tags = [(hit.value, hit.count) for hit in tag_facet.hits]
+            return top_tags, len(user_facet.hits)
+        except Exception as e:
+            logger.debug("Facet stats unavailable for %s: %s", collection, e)
+            return None, None
+
+    def _iter_scroll(
+        self,
+        collection: str,
+        batch: int = 512,
+        with_payload: Any = True,
+        with_vectors: bool = False,
+    ):
+        """Yield point batches from a collection via paginated scroll.
+
+        Each page is fetched with the previous page's next_page_offset, so
+        callers can aggregate incrementally and peak memory stays bounded
+        by the batch size instead of the collection size.
+        """
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=collection,
+                limit=batch,
+                offset=offset,
+                with_payload=with_payload,
+                with_vectors=with_vectors,
+            )
+            if points:
+                yield points
+            if offset is None:
+                break
+
+    def _cache_embedding(self, key: bytes, embedding: np.ndarray) -> None:
+        with self._embedding_cache_lock:
+            self._embedding_cache[key] = embedding
+            self._embedding_cache.move_to_end(key)
+            while len(self._embedding_cache) > self._embedding_cache_capacity:
+                self._embedding_cache.popitem(last=False)
+
+    def _embed_text(self, text: str) -> np.ndarray:
+        """Generate embedding for text, consulting the LRU cache first.
+
+        Returns a float32 numpy array: qdrant-client accepts it directly
+        as a query vector, it caches at 4 bytes per dimension instead of
+        a boxed Python float per element, and callers that really need a
+        list (e.g. PointStruct payloads) can convert at the call site.
+        """
+        if not self.embedding_model:
+            raise RuntimeError("Embedding model not initialized")
+
+        key = self._embedding_cache_key(text)
+        with self._embedding_cache_lock:
+            cached = self._embedding_cache.get(key)
+            if cached is not None:
+                self._embedding_cache.move_to_end(key)
+                return cached
+
+        embedding = np.asarray(self.embedding_model.encode(text), dtype=np.float32)
+        self._cache_embedding(key, embedding)
+        return embedding
+
+    def _embed_texts(
+        self, texts: List[str], batch_size: Optional[int] = None
+    ) -> np.ndarray:
+        """Embed a batch of texts with one encoder call for the misses.
+
+        Cache hits are served from the embedding LRU; everything else is
+        encoded in a single batched pass, which saturates the model far
+        better than per-text encode() calls. Returns a float32 matrix
+        with one row per input text, in input order. The default batch
+        size is raised on GPU, which keeps scaling well past the CPU
+        sweet spot.
+        """
         if not self.embedding_model:
             raise RuntimeError("Embedding model not initialized")
-        return self.embedding_model.encode(text).tolist()
+
+        if batch_size is None:
+            on_gpu = str(getattr(self.embedding_model, "device", "cpu")) != "cpu"
+            batch_size = 256 if on_gpu else 64
+
+        rows: List[Optional[np.ndarray]] = []
+        misses = []
+        with self._embedding_cache_lock:
+            for text in texts:
+                key = self._embedding_cache_key(text)
+                cached = self._embedding_cache.get(key)
+                if cached is not None:
+                    self._embedding_cache.move_to_end(key)
+                else:
+                    misses.append((len(rows), key, text))
+                rows.append(cached)
+
+        if misses:
+            embeddings = np.asarray(
+                self.embedding_model.encode(
+                    [text for _, _, text in misses],
+                    batch_size=batch_size,
+                    show_progress_bar=False,
+                ),
+                dtype=np.float32,
+            )
+            for (index, key, _), embedding in zip(misses, embeddings):
+                rows[index] = embedding
+                self._cache_embedding(key, embedding)
+
+        return np.stack(rows)
+
+    def warmup_embedding_cache(self, queries: List[str]) -> None:
+        """Batch-encode known-popular queries into the embedding cache."""
+        if not queries or not self.embedding_model:
+            return
+
+        embeddings = self.embedding_model.encode(
+            queries, batch_size=64, show_progress_bar=False
+        )
+        for text, embedding in zip(queries, embeddings):
+            self._cache_embedding(
+                self._embedding_cache_key(text),
+                np.asarray(embedding, dtype=np.float32),
+            )
 
     def _generate_content_hash(self, content: str) -> str:
-        """Generate unique hash for content as valid UUID."""
-        import uuid
+        """Generate a deterministic content ID as a valid UUID string.
+
+        Delegates to the memoized content_uuid helper so this and
+        EmbeddingService produce identical IDs for the same content.
+        """
+        from .memory.embedding_service import content_uuid
 
-        # Generate a deterministic UUID5 from content
-        # Use a fixed namespace UUID for consistency
-        namespace = uuid.UUID("12345678-1234-5678-1234-123456789abc")
-        return str(uuid.uuid5(namespace, content))
+        return content_uuid(content)
 
     def _add_memory_sync(
-        self, collection_name: str, content: str, metadata: Dict[str, Any] = None
+        self,
+        collection_name: str,
+        content: str,
+        metadata: Dict[str, Any] = None,
+        wait: bool = False,
     ) -> Dict[str, Any]:
         """Sync wrapper for add_memory method."""
         try:
@@ -794,23 +1404,27 @@ class GenericMemoryService:
             embedding = self._embed_text(content)
             memory_id = self._generate_content_hash(content)
 
-            # Prepare metadata
-            if metadata is None:
-                metadata = {}
-
-            metadata.update(
-                {
-                    "content": content,
-                    "timestamp": datetime.now().isoformat(),
-                    "added_by": self.current_user,
-                }
+            # Prepare payload without mutating the caller's metadata dict;
+            # plain key assignments skip the intermediate dict a spread or
+            # update-with-literal would allocate
+            payload = dict(metadata) if metadata else {}
+            payload["content"] = content
+            payload["content_len"] = len(content)
+            payload["timestamp"] = self._now_iso()
+            payload["added_by"] = self.current_user
+
+            # Create point for storage; PointStruct validates List[float],
+            # so convert the cached float32 array here at the boundary
+            point = PointStruct(
+                id=memory_id, vector=embedding.tolist(), payload=payload
             )
 
-            # Create point for storage
-            point = PointStruct(id=memory_id, vector=embedding, payload=metadata)
-
-            # Store in Qdrant
-            self.client.upsert(collection_name=collection_name, points=[point])
+            # Store in Qdrant; wait=False skips the server-side WAL-flush
+            # wait that dominates single-insert latency
+            self.client.upsert(
+                collection_name=collection_name, points=[point], wait=wait
+            )
+            self._invalidate_query_cache()
 
             return {
                 "success": True,
@@ -832,41 +1446,165 @@ class GenericMemoryService:
         """Sync wrapper for search_memory method."""
         try:
             query_embedding = self._embed_text(query)
-            all_results = []
-
-            for collection_name in collection_names:
-                try:
-                    results = self.client.search(
-                        collection_name=collection_name,
-                        query_vector=query_embedding,
-                        limit=limit,
-                        score_threshold=min_score,
-                    )
 
-                    for result in results:
-                        all_results.append(
-                            {
-                                "content": result.payload.get("content", ""),
-                                "score": result.score,
-                                "collection": collection_name,
-                                "metadata": result.payload,
-                            }
-                        )
+            def _search_one(collection_name: str):
+                # Small collections are mirrored in-process and scored
+                # with one BLAS mat-vec — no Qdrant round-trip at all
+                local = self._local_search(
+                    collection_name, query_embedding, limit, min_score
+                )
+                if local is not None:
+                    return local
+                return self.client.search(
+                    collection_name=collection_name,
+                    query_vector=query_embedding,
+                    limit=limit,
+                    score_threshold=min_score,
+                )
 
+            # The client releases the GIL during network I/O, so a small
+            # thread pool turns the per-collection round-trips from a sum
+            # into a max. A single collection skips the pool entirely.
+            collected = []
+            if len(collection_names) == 1:
+                name = collection_names[0]
+                try:
+                    collected.append((name, _search_one(name)))
                 except Exception as e:
-                    logger.warning(f"Failed to search {collection_name}: {e}")
-                    continue
+                    logger.warning(f"Failed to search {name}: {e}")
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(16, len(collection_names))
+                ) as executor:
+                    futures = [
+                        executor.submit(_search_one, name)
+                        for name in collection_names
+                    ]
+                    for name, future in zip(collection_names, futures):
+                        try:
+                            collected.append((name, future.result(timeout=10)))
+                        except Exception as e:
+                            logger.warning(f"Failed to search {name}: {e}")
+
+            # Bounded merge: a min-heap of at most `limit` lean
+            # (score, seq, payload, collection) tuples instead of keeping
+            # all N*limit hits and slicing. Hits scoring below the current
+            # heap minimum are rejected on arrival; the seq counter breaks
+            # score ties so payload dicts are never compared. The 4-key
+            # response dicts are only built for the winners.
+            heap: List[tuple] = []
+            total_results = 0
+            for collection_name, results in collected:
+                for result in results:
+                    total_results += 1
+                    if len(heap) < limit:
+                        heapq.heappush(
+                            heap,
+                            (result.score, total_results, result.payload,
+                             collection_name),
+                        )
+                    elif result.score > heap[0][0]:
+                        heapq.heapreplace(
+                            heap,
+                            (result.score, total_results, result.payload,
+                             collection_name),
+                        )
 
-            # Sort by score
-            all_results.sort(key=lambda x: x["score"], reverse=True)
+            heap.sort(key=operator.itemgetter(0), reverse=True)
 
             return {
                 "success": True,
-                "results": all_results[:limit],
+                "results": [
+                    {
+                        "content": payload.get("content", ""),
+                        "score": score,
+                        "collection": collection_name,
+                        "metadata": payload,
+                    }
+                    for score, _, payload, collection_name in heap
+                ],
                 "query": query,
-                "total_results": len(all_results),
+                "total_results": total_results,
             }
 
         except Exception as e:
             logger.error(f"Search failed: {e}")
-            return {"success": False, "error": str(e)}
\ No newline at end of file
+            return {"success": False, "error": str(e)}
+
+    def _search_memory_batch_sync(
+        self,
+        collection_names: List[str],
+        queries: List[str],
+        limit: int = 10,
+        min_score: float = 0.3,
+    ) -> List[Dict[str, Any]]:
+        """Search several queries at once, embedding them in one pass.
+
+        Agents that loop over `_search_memory_sync` pay one encoder call
+        per query; here all queries are embedded in a single batched
+        encode and every (query, collection) pair is dispatched
+        concurrently. Returns one result dict per query, in input order,
+        each shaped like a `_search_memory_sync` response.
+        """
+        try:
+            embeddings = self._embed_texts(queries)
+        except Exception as e:
+            logger.error(f"Batch embedding failed: {e}")
+            return [{"success": False, "error": str(e)} for _ in queries]
+
+        def _search_one(query_index: int, collection_name: str):
+            query_embedding = embeddings[query_index]
+            local = self._local_search(
+                collection_name, query_embedding, limit, min_score
+            )
+            if local is not None:
+                return local
+            return self.client.search(
+                collection_name=collection_name,
+                query_vector=query_embedding,
+                limit=limit,
+                score_threshold=min_score,
+            )
+
+        pairs = [
+            (query_index, name)
+            for query_index in range(len(queries))
+            for name in collection_names
+        ]
+        merged: List[List[tuple]] = [[] for _ in queries]
+        with ThreadPoolExecutor(max_workers=min(16, max(1, len(pairs)))) as executor:
+            futures = [
+                executor.submit(_search_one, query_index, name)
+                for query_index, name in pairs
+            ]
+            for (query_index, name), future in zip(pairs, futures):
+                try:
+                    for result in future.result(timeout=10):
+                        merged[query_index].append(
+                            (result.score, result.payload, name)
+                        )
+                except Exception as e:
+                    logger.warning(f"Failed to search {name}: {e}")
+
+        responses = []
+        for query, all_results in zip(queries, merged):
+            top_results = heapq.nlargest(
+                limit, all_results, key=operator.itemgetter(0)
+            )
+            responses.append(
+                {
+                    "success": True,
+                    "results": [
+                        {
+                            "content": payload.get("content", ""),
+                            "score": score,
+                            "collection": collection_name,
+                            "metadata": payload,
+                        }
+                        for score, payload, collection_name in top_results
+                    ],
+                    "query": query,
+                    "total_results": len(all_results),
+                }
+            )
+        return responses
\ No newline at end of file
@@ -3,7 +3,8 @@ System and collections handlers for MCP Memory Server.
 Handles system health monitoring and generic collection operations.
 """
 
-from typing import Dict, Any
+import time
+from typing import Any, Dict, Optional, Tuple
 from datetime import datetime
 
 try:
@@ -24,21 +25,55 @@ except ImportError:
 
 logger = get_logger("system-collections-handlers")
 
+# Rendered per component on every health call; looked up instead of
+# re-evaluating chained conditionals
+_STATUS_ICONS = {"healthy": "✅", "unavailable": "⚠️"}
+_BOOL_ICONS = ("❌", "✅")
+
+# Current-second timestamp cache for the health report; polling bursts
+# reuse the formatted string instead of re-running the datetime formatter
+_ts_cache: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """ISO timestamp at second resolution, formatted once per second."""
+    global _ts_cache
+    second = int(time.time())
+    if second != _ts_cache[0]:
+        _ts_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return _ts_cache[1]
+
 
 class SystemAndCollectionsHandlers:
     """Handles system health and generic collection operations."""
 
+    # How long a get_collections response may serve health checks; absorbs
+    # bursty liveness polling without hiding real outages for long
+    _COLLECTIONS_CACHE_TTL = 2.0
+
     def __init__(self, memory_manager, markdown_processor=None):
         """Initialize with memory manager and optional processors."""
         self.memory_manager = memory_manager
         self.markdown_processor = markdown_processor
+        self._collections_cache: Optional[Tuple[float, Any]] = None
+
+    def _get_collections_cached(self):
+        """Qdrant collection listing with a short TTL for health polling."""
+        now = time.monotonic()
+        cached = self._collections_cache
+        if cached is not None and now - cached[0] < self._COLLECTIONS_CACHE_TTL:
+            return cached[1]
+
+        collections = self.memory_manager.client.get_collections()
+        self._collections_cache = (now, collections)
+        return collections
 
     def handle_system_health(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle system health check tool call."""
         try:
             # Get health information
             health_info = {
-                "timestamp": str(datetime.now()),
+                "timestamp": _now_iso(),
                 "memory_manager": {
                     "available": self.memory_manager is not None,
                     "initialized": (
@@ -61,7 +96,7 @@ class SystemAndCollectionsHandlers:
                         hasattr(self.memory_manager, "client")
                         and self.memory_manager.client
                     ):
-                        collections = self.memory_manager.client.get_collections()
+                        collections = self._get_collections_cached()
                         health_info["components"]["qdrant"] = {
                             "status": "healthy",
                             "collections_count": len(collections.collections),
@@ -115,60 +150,60 @@ class SystemAndCollectionsHandlers:
 
             health_info["overall_status"] = overall_status
 
-            # Format health info for display
-            health_text = f"""# System Health Report
+            # Format health info for display; accumulate chunks and join
+            # once instead of growing one string per line
+            parts = [
+                f"""# System Health Report
 
-**Status:** {status_text}  
+**Status:** {status_text}
 **Timestamp:** {health_info["timestamp"]}
 
 ## Component Status
 
 ### Memory Manager
-- **Available:** {"✅" if health_info["memory_manager"]["available"] else "❌"}
-- **Initialized:** {"✅" if health_info["memory_manager"]["initialized"] else "❌"}
+- **Available:** {_BOOL_ICONS[bool(health_info["memory_manager"]["available"])]}
+- **Initialized:** {_BOOL_ICONS[bool(health_info["memory_manager"]["initialized"])]}
 
 ### Components
 """
+            ]
 
             for component, info in health_info["components"].items():
                 if isinstance(info, dict):
                     status = info.get("status", "unknown")
-                    if status == "healthy":
-                        status_icon = "✅"
-                    elif status == "unavailable":
-                        status_icon = "⚠️"
-                    else:
-                        status_icon = "❌"
+                    status_icon = _STATUS_ICONS.get(status, "❌")
 
-                    health_text += (
+                    parts.append(
                         f"- **{component.replace('_', ' ').title()}:** "
                         f"{status_icon} {status}\n"
                     )
 
                     if "error" in info:
-                        health_text += f"  - Error: {info['error']}\n"
+                        parts.append(f"  - Error: {info['error']}\n")
                 else:
-                    health_text += (
+                    parts.append(
                         f"- **{component.replace('_', ' ').title()}:** "
-                        f"{ '✅' if info else '❌'}\n"
+                        f"{_BOOL_ICONS[bool(info)]}\n"
                     )
 
             # Add error statistics if available
             error_stats = health_info.get("error_statistics", {})
             if error_stats.get("total_errors", 0) > 0:
-                health_text += f"""
+                parts.append(
+                    f"""
 ## Error Statistics
 - **Total Errors:** {error_stats.get("total_errors", 0)}
 - **Recovery Attempts:** {error_stats.get("recovery_attempts", 0)}
 - **Successful Recoveries:** {error_stats.get("successful_recoveries", 0)}
 """
+                )
 
                 if error_stats.get("errors_by_category"):
-                    health_text += "\n### Errors by Category\n"
+                    parts.append("\n### Errors by Category\n")
                     for category, count in error_stats["errors_by_category"].items():
-                        health_text += f"- **{category.title()}:** {count}\n"
+                        parts.append(f"- **{category.title()}:** {count}\n")
 
-            return {"content": [{"type": "text", "text": health_text}]}
+            return {"content": [{"type": "text", "text": "".join(parts)}]}
 
         except Exception as e:
             logger.error(f"Error in system health check: {e}")
@@ -248,7 +283,7 @@ class SystemAndCollectionsHandlers:
                 }
 
             collections = collections_result.get("collections", [])
-            result_text = f"Found {len(collections)} collections:\n\n"
+            parts = [f"Found {len(collections)} collections:\n\n"]
 
             for collection in collections:
                 name = collection.get("name", "unknown")
@@ -256,9 +291,9 @@ class SystemAndCollectionsHandlers:
                 metadata = collection.get("metadata") or {}
                 stats = collection.get("stats") or {}
 
-                result_text += f"**{name}**\n"
+                parts.append(f"**{name}**\n")
                 if description:
-                    result_text += f"  Description: {description}\n"
+                    parts.append(f"  Description: {description}\n")
 
                 if include_stats:
                     document_count = (
@@ -267,13 +302,13 @@ class SystemAndCollectionsHandlers:
                         or stats.get("vectors_count")
                         or 0
                     )
-                    result_text += f"  Documents: {document_count}\n"
+                    parts.append(f"  Documents: {document_count}\n")
 
                 if metadata:
-                    result_text += f"  Metadata: {metadata}\n"
-                result_text += "\n"
+                    parts.append(f"  Metadata: {metadata}\n")
+                parts.append("\n")
 
-            return {"content": [{"type": "text", "text": result_text}]}
+            return {"content": [{"type": "text", "text": "".join(parts)}]}
         except Exception as e:
             logger.error(f"Error listing collections: {e}")
             return {
@@ -362,20 +397,21 @@ class SystemAndCollectionsHandlers:
                     f"for query: '{query}'"
                 )
             else:
-                result_text = (
+                parts = [
                     f"Found {len(results)} results in collection "
                     f"'{collection_name}':\n\n"
-                )
+                ]
 
                 for i, result in enumerate(results, 1):
-                    result_text += (
+                    parts.append(
                         f"**Result {i}** (Score: {result.get('score', 'N/A'):.3f})\n"
                     )
-                    result_text += f"{result['content']}\n"
+                    parts.append(f"{result['content']}\n")
 
                     if include_metadata and result.get("metadata"):
-                        result_text += f"Metadata: {result['metadata']}\n"
-                    result_text += "\n"
+                        parts.append(f"Metadata: {result['metadata']}\n")
+                    parts.append("\n")
+                result_text = "".join(parts)
 
             return {"content": [{"type": "text", "text": result_text}]}
         except Exception as e:
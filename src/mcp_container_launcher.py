@@ -2,26 +2,31 @@
 
 from __future__ import annotations
 
-import argparse
-import asyncio
+# Heavier stdlib modules (subprocess, shutil, argparse, asyncio) and the MCP
+# server stack are imported inside the functions that need them: this module
+# is a cold-start entrypoint and several paths (e.g. --skip-qdrant-start,
+# --help) never touch the docker helpers at all.
+import functools
+import http.client
+import json
 import os
-import shutil
-import subprocess
+import socket
 import sys
-from dataclasses import dataclass
+import urllib.parse
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
-from src.mcp_server import run_mcp_server
+if TYPE_CHECKING:
+    import subprocess
 
 
 README_QDRANT_RUN_COMMAND = (
-    "docker run --pull-always -p 6333:6333 "
+    "docker run --pull-always -p 6333:6333 -p 6334:6334 "
     "-v $(pwd)/qdrant_storage:/qdrant/storage qdrant/qdrant:v1.16.0"
 )
 
 
-@dataclass(frozen=True)
-class LaunchConfig:
+class LaunchConfig(NamedTuple):
     qdrant_image: str
     qdrant_container: str
     qdrant_port: str
@@ -35,9 +40,58 @@ class CommandError(RuntimeError):
 
 
 def run_command(
-    command: list[str], check: bool = True
+    command: list[str], check: bool = True, stream_output: bool = False
 ) -> subprocess.CompletedProcess[str]:
-    result = subprocess.run(command, capture_output=True, text=True)
+    """Run a docker command, capturing output via pre-opened temp files.
+
+    capture_output=True creates pipes, which together with the default
+    close_fds=True pushes CPython off its os.posix_spawn fast path onto
+    fork()+exec — and fork must copy this process's page tables on every
+    call. Redirecting to inheritable temp-file descriptors keeps the
+    posix_spawn path while still letting us read back stdout/stderr.
+
+    With stream_output=True, output is relayed to stderr as it arrives
+    instead of being buffered wholesale — meant for docker run/pull, whose
+    layer-progress output can reach megabytes and is otherwise invisible
+    until the command finishes. Only a bounded tail of stderr is retained
+    so error recovery can still inspect it.
+    """
+    import subprocess
+
+    if stream_output:
+        import collections
+
+        process = subprocess.Popen(
+            command, stdout=sys.stderr.buffer, stderr=subprocess.PIPE
+        )
+        assert process.stderr is not None
+        tail: collections.deque[bytes] = collections.deque(maxlen=8)
+        for chunk in iter(lambda: process.stderr.read(8192), b""):
+            sys.stderr.buffer.write(chunk)
+            sys.stderr.buffer.flush()
+            tail.append(chunk)
+        result = subprocess.CompletedProcess(
+            command,
+            process.wait(),
+            "",
+            b"".join(tail).decode(errors="replace"),
+        )
+    else:
+        import tempfile
+
+        with tempfile.TemporaryFile() as stdout, tempfile.TemporaryFile() as stderr:
+            raw = subprocess.run(
+                command, stdout=stdout, stderr=stderr, close_fds=False
+            )
+            stdout.seek(0)
+            stderr.seek(0)
+            result = subprocess.CompletedProcess(
+                raw.args,
+                raw.returncode,
+                stdout.read().decode(errors="replace"),
+                stderr.read().decode(errors="replace"),
+            )
+
     if check and result.returncode != 0:
         raise CommandError(
             f"Command failed: {' '.join(command)}\n"
@@ -47,65 +101,235 @@ def run_command(
     return result
 
 
-def command_succeeds(command: list[str]) -> bool:
-    return subprocess.run(command, capture_output=True, text=True).returncode == 0
+@functools.lru_cache(maxsize=1)
+def _docker_bin() -> str:
+    """Absolute path of the docker binary, resolved via $PATH exactly once.
 
+    Handing subprocess the absolute path also spares every spawned process
+    the execvp $PATH walk (one stat per PATH entry per call).
+    """
+    import shutil
 
-def ensure_docker_available() -> None:
-    if shutil.which("docker") is None:
+    path = shutil.which("docker")
+    if path is None:
         raise CommandError("Docker is not installed or not available in PATH.")
+    return path
+
+
+def ensure_docker_available() -> None:
+    _docker_bin()
+
+
+DOCKER_SOCKET_PATH = "/var/run/docker.sock"
+
+
+class _DockerSocketConnection(http.client.HTTPConnection):
+    """HTTP connection to the Docker Engine API over its UNIX socket."""
+
+    def __init__(
+        self,
+        socket_path: str = DOCKER_SOCKET_PATH,
+        timeout: float | None = None,
+    ) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class DockerSocketClient:
+    """Minimal Docker Engine API client over the local UNIX socket.
+
+    Keeps a single HTTP/1.1 keep-alive connection open across calls so
+    repeated requests in one launch pay the socket handshake once, instead
+    of once per call (or a full docker CLI startup per call). All methods
+    are best-effort: they signal 'socket unusable' so callers can fall back
+    to the docker CLI.
+    """
+
+    def __init__(
+        self,
+        socket_path: str = DOCKER_SOCKET_PATH,
+        timeout: float | None = None,
+    ) -> None:
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._conn: _DockerSocketConnection | None = None
+
+    def available(self) -> bool:
+        return os.path.exists(self.socket_path)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _request(self, method: str, path: str) -> tuple[int, bytes] | None:
+        """Issue one request on the shared connection; None if unusable."""
+        if not self.available():
+            return None
+
+        # Retry once with a fresh connection in case the kept-alive one
+        # was closed by the daemon between calls.
+        for _ in range(2):
+            if self._conn is None:
+                self._conn = _DockerSocketConnection(
+                    self.socket_path, timeout=self.timeout
+                )
+            try:
+                self._conn.request(method, path)
+                response = self._conn.getresponse()
+                return response.status, response.read()
+            except OSError:
+                self.close()
+        return None
+
+    def container_running(self, name: str) -> bool | None:
+        """True/False for an existing container, None when unknowable."""
+        reply = self._request("GET", f"/containers/{name}/json")
+        if reply is None:
+            return None
+        status, body = reply
+        if status != 200:
+            return None
+        try:
+            return bool(json.loads(body).get("State", {}).get("Running"))
+        except ValueError:
+            return None
+
+    def start_container(self, name: str) -> bool | None:
+        """Start a container with one Engine API call.
+
+        Returns True when the container is running afterwards (started now
+        or already running), False when it does not exist, and None when
+        the socket is unavailable so the caller can use the CLI.
+        """
+        reply = self._request("POST", f"/containers/{name}/start")
+        if reply is None:
+            return None
+        status, _ = reply
+        if status in (204, 304):  # 304 = already running
+            return True
+        if status == 404:
+            return False
+        return None
+
+    def wait_for_start(self, name: str, timeout: float = 30.0) -> None:
+        """Block until the container reports a running state.
+
+        Checks the current state once, then subscribes to the Engine
+        /events stream filtered to this container's start events: a single
+        blocking read that wakes exactly at the state transition, instead
+        of an inspect polling loop. Best-effort — returns silently when the
+        socket is unavailable or the deadline passes, leaving error
+        reporting to the Qdrant connection. The event stream uses its own
+        connection because it occupies the socket until closed.
+        """
+        if self.container_running(name):
+            return
+        if not self.available():
+            return
 
+        filters = urllib.parse.quote(
+            json.dumps({"container": [name], "event": ["start"]})
+        )
+        events = _DockerSocketConnection(self.socket_path, timeout=timeout)
+        try:
+            events.request("GET", f"/events?filters={filters}")
+            stream = events.getresponse()
+            while True:
+                line = stream.readline()
+                if not line:
+                    return
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if event.get("status") == "start":
+                    return
+        except OSError:
+            return
+        finally:
+            events.close()
 
-def container_exists(name: str) -> bool:
-    return command_succeeds(["docker", "inspect", name])
 
+@functools.lru_cache(maxsize=1)
+def _docker_pull_flag() -> tuple[str, ...]:
+    """Return the pull-flag spelling supported by the local docker client.
 
-def container_running(name: str) -> bool:
+    `docker run` grew `--pull always` in 19.03; older clients only accept
+    `--pull-always`. Probing the client version once replaces the previous
+    try/run, parse stderr for 'unknown flag', retry dance, which doubled the
+    worst-case latency of a genuinely failing run.
+    """
     result = run_command(
-        ["docker", "inspect", "--format", "{{.State.Running}}", name], check=False
+        [_docker_bin(), "version", "--format", "{{.Client.Version}}"], check=False
     )
-    return result.returncode == 0 and result.stdout.strip() == "true"
+    try:
+        version = tuple(
+            int(part) for part in result.stdout.strip().split(".")[:2]
+        )
+    except ValueError:
+        return ("--pull", "always")
+    return ("--pull", "always") if version >= (19, 3) else ("--pull-always",)
 
 
-def _run_qdrant_container(config: LaunchConfig, pull_always_style: str) -> None:
+def _run_qdrant_container(config: LaunchConfig) -> None:
+    # docker run pulls the image itself when it is missing locally, so no
+    # separate `docker image inspect` / `docker pull` pre-check is needed.
     storage_dir = Path(config.qdrant_storage_dir).resolve()
-    storage_dir.mkdir(parents=True, exist_ok=True)
+    # Warm path: a single stat() beats an unconditional mkdir(2) that fails
+    # with EEXIST and gets swallowed.
+    if not storage_dir.is_dir():
+        storage_dir.mkdir(parents=True, exist_ok=True)
 
     command = [
-        "docker",
+        _docker_bin(),
         "run",
         "-d",
         "--name",
         config.qdrant_container,
         "-p",
         f"{config.qdrant_port}:6333",
+        # Expose the gRPC port too so clients can opt in via
+        # QDRANT_PREFER_GRPC without recreating the container
+        "-p",
+        f"{os.environ.get('QDRANT_GRPC_PORT', '6334')}:6334",
         "-v",
         f"{storage_dir}:/qdrant/storage",
+        *_docker_pull_flag(),
+        config.qdrant_image,
     ]
-
-    if pull_always_style == "pull-always":
-        command.append("--pull-always")
-    else:
-        command.extend(["--pull", "always"])
-
-    command.append(config.qdrant_image)
-    run_command(command)
+    # The pull happens inline here; stream its progress instead of buffering.
+    run_command(command, stream_output=True)
 
 
-def ensure_qdrant_container(config: LaunchConfig) -> None:
+def ensure_qdrant_container(config: LaunchConfig, docker: DockerSocketClient) -> None:
     if config.skip_qdrant_start:
         return
 
-    if container_running(config.qdrant_container):
+    # Optimistic start: a no-op when the container is already running,
+    # starts it when stopped, and fails recognizably only when the container
+    # does not exist yet. Prefer a single Engine API call over the socket;
+    # fall back to the CLI when the socket is unreachable.
+    socket_state = docker.start_container(config.qdrant_container)
+    if socket_state is True:
         return
-
-    if container_exists(config.qdrant_container):
-        print(
-            f"Starting existing container '{config.qdrant_container}'...",
-            file=sys.stderr,
+    if socket_state is None:
+        start_result = run_command(
+            [_docker_bin(), "start", config.qdrant_container], check=False
         )
-        run_command(["docker", "start", config.qdrant_container])
-        return
+        if start_result.returncode == 0:
+            return
+        if "No such container" not in start_result.stderr:
+            raise CommandError(
+                f"Failed to start container '{config.qdrant_container}':\n"
+                f"stderr: {start_result.stderr.strip()}"
+            )
 
     print(
         f"Creating and starting container '{config.qdrant_container}'...",
@@ -114,14 +338,10 @@ def ensure_qdrant_container(config: LaunchConfig) -> None:
     print(f"Base command: {README_QDRANT_RUN_COMMAND}", file=sys.stderr)
 
     try:
-        _run_qdrant_container(config, pull_always_style="pull-always")
+        _run_qdrant_container(config)
     except CommandError as exc:
-        error_text = str(exc)
-        if "unknown flag: --pull-always" in error_text:
-            _run_qdrant_container(config, pull_always_style="pull")
-            return
-        if "is already in use by container" in error_text:
-            run_command(["docker", "start", config.qdrant_container], check=False)
+        if "is already in use by container" in str(exc):
+            run_command([_docker_bin(), "start", config.qdrant_container], check=False)
             return
         raise
 
@@ -136,7 +356,37 @@ def resolve_server_mode() -> str:
     return "full"
 
 
+def _config_from_env() -> LaunchConfig:
+    """Build LaunchConfig straight from the environment.
+
+    Fast path for the common no-flags invocation: skips constructing an
+    ArgumentParser (and importing argparse at all) when every value comes
+    from env vars or defaults anyway. Defaults must stay in sync with the
+    argparse declarations in _parse_argv.
+    """
+    return LaunchConfig(
+        qdrant_image=os.environ.get("QDRANT_IMAGE", "qdrant/qdrant:v1.16.0"),
+        qdrant_container=os.environ.get("QDRANT_CONTAINER", "mcp-qdrant"),
+        qdrant_port=os.environ.get("QDRANT_PORT", "6333"),
+        qdrant_storage_dir=os.environ.get(
+            "QDRANT_STORAGE_DIR", str(Path.cwd() / "qdrant_storage")
+        ),
+        skip_qdrant_start=(
+            os.environ.get("SKIP_QDRANT_START", "").lower() in {"1", "true", "yes"}
+        ),
+        server_mode=resolve_server_mode(),
+    )
+
+
 def parse_args() -> LaunchConfig:
+    if len(sys.argv) == 1:
+        return _config_from_env()
+    return _parse_argv()
+
+
+def _parse_argv() -> LaunchConfig:
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Start MCP server via uvx and ensure a single Qdrant container."
     )
@@ -187,10 +437,22 @@ def parse_args() -> LaunchConfig:
 
 
 def main() -> int:
+    import asyncio
+
+    from src.mcp_server import run_mcp_server
+
     try:
         config = parse_args()
-        ensure_docker_available()
-        ensure_qdrant_container(config)
+        # With --skip-qdrant-start (external Qdrant) docker is irrelevant:
+        # skip the PATH lookup and never touch the socket
+        if not config.skip_qdrant_start:
+            ensure_docker_available()
+            docker = DockerSocketClient()
+            try:
+                ensure_qdrant_container(config, docker)
+                docker.wait_for_start(config.qdrant_container)
+            finally:
+                docker.close()
         os.environ.setdefault("QDRANT_HOST", "localhost")
         os.environ.setdefault("QDRANT_PORT", config.qdrant_port)
         asyncio.run(run_mcp_server(config.server_mode))
@@ -15,6 +15,21 @@ except ImportError:
 
 logger = get_logger("mcp-protocol")
 
+# orjson serializes mixed dict/list payloads several times faster than
+# stdlib json — worth it for large search-result responses — but stays
+# optional: stdlib json is the fallback. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so the decode error handling below covers both.
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 
 class MCPProtocolHandler:
     """Handles MCP protocol communication and message routing."""
@@ -22,6 +37,9 @@ class MCPProtocolHandler:
     def __init__(self, server_instance):
         """Initialize with a server instance to delegate to."""
         self.server = server_instance
+        # The init response only depends on server_mode, which is fixed
+        # for the server's lifetime — build it once, reuse on reconnects
+        self._init_response: Optional[Dict[str, Any]] = None
     
     @staticmethod
     def send_response(
@@ -37,7 +55,7 @@ class MCPProtocolHandler:
         else:
             response["result"] = result
         
-        print(json.dumps(response), flush=True)
+        print(_json_dumps(response), flush=True)
 
     @staticmethod
     def send_notification(method: str, params: Dict[str, Any] = None):
@@ -47,10 +65,12 @@ class MCPProtocolHandler:
         if params:
             notification["params"] = params
         
-        print(json.dumps(notification), flush=True)
+        print(_json_dumps(notification), flush=True)
 
     def get_init_response(self) -> Dict[str, Any]:
         """Build MCP initialization response based on server mode."""
+        if self._init_response is not None:
+            return self._init_response
         capabilities = {}
         
         # Always include tools (unless prompts-only mode)
@@ -65,11 +85,12 @@ class MCPProtocolHandler:
         if self.server.server_mode in ["full", "prompts-only"]:
             capabilities["prompts"] = {"listChanged": False}
         
-        return {
+        self._init_response = {
             "protocolVersion": MCP_PROTOCOL_VERSION,
             "capabilities": capabilities,
             "serverInfo": MCP_SERVER_INFO
         }
+        return self._init_response
 
     async def handle_message(self, data: Dict[str, Any]) -> None:
         """Handle a single MCP protocol message."""
@@ -159,7 +180,7 @@ class MCPProtocolHandler:
         # Process MCP protocol messages
         for line in sys.stdin:
             try:
-                data = json.loads(line.strip())
+                data = _json_loads(line.strip())
                 logger.info(f"Received: {data}")
                 
                 await self.handle_message(data)
@@ -4,10 +4,14 @@ Handles the MCP protocol communication and tool orchestration.
 Enhanced with production-grade error handling and monitoring.
 """
 
+import asyncio
 import json
+from functools import cached_property
 from typing import Dict, Any, List, Optional
 
-from .server_config import get_logger
+import logging
+
+from .server_config import get_logger, LOGGING_LEVEL
 from .qdrant_manager import ensure_qdrant_running
 from .tool_handlers import ToolHandlers
 from .resource_handlers import ResourceHandlers
@@ -18,6 +22,32 @@ from .system_health_monitor import SystemHealthMonitor
 
 logger = get_logger("mcp-server")
 
+# Resource payloads are consumed by programs, so compact JSON (~30%
+# smaller than indent=2) is the default; pretty-printing is kept for
+# DEBUG-level runs where a human reads the payloads.
+_PRETTY_JSON = LOGGING_LEVEL <= logging.DEBUG
+
+# orjson serializes large payloads several times faster than stdlib
+# json, so use it when installed.
+try:
+    import orjson
+
+    # OPT_SERIALIZE_NUMPY lets numpy scalars/arrays (e.g. scores in
+    # search results) serialize directly without a Python-side cast
+    _ORJSON_OPTION = orjson.OPT_SERIALIZE_NUMPY | (
+        orjson.OPT_INDENT_2 if _PRETTY_JSON else 0
+    )
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=_ORJSON_OPTION).decode()
+
+except ImportError:
+
+    def _dumps(obj: Any) -> str:
+        if _PRETTY_JSON:
+            return json.dumps(obj, indent=2, ensure_ascii=False)
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
 # Import our memory manager
 try:
     from .memory_manager import QdrantMemoryManager
@@ -35,6 +65,17 @@ class MemoryMCPServer:
     def __init__(self, server_mode="full"):
         self.server_mode = server_mode
         logger.info(f"Starting Memory MCP Server in {server_mode.upper()} mode...")
+        # The memory manager (Qdrant startup + embedding model load) and
+        # the handlers built on it are deferred to first use via
+        # cached_property, so the initialize/tools-list handshake is not
+        # blocked behind a multi-hundred-ms model load.
+        logger.info("Memory MCP Server initialized (components load on demand)")
+
+    @cached_property
+    def memory_manager(self) -> Optional["QdrantMemoryManager"]:
+        """Memory manager, created on first access."""
+        if not MEMORY_AVAILABLE:
+            return None
 
         # Ensure Qdrant is running before initializing memory manager
         if not ensure_qdrant_running():
@@ -42,30 +83,34 @@ class MemoryMCPServer:
                 "❌ Failed to start Qdrant. Memory server will not function properly."
             )
 
-        if MEMORY_AVAILABLE:
-            try:
-                self.memory_manager = QdrantMemoryManager()
-                logger.info("Memory manager initialized")
-            except Exception as e:
-                logger.error(f"Failed to initialize memory manager: {e}")
-                self.memory_manager = None
-        else:
-            self.memory_manager = None
-
-        # Initialize handlers and monitors
-        self.tool_handlers = ToolHandlers(self.memory_manager)
-        self.resource_handlers = ResourceHandlers(self.memory_manager)
-        self.health_monitor = SystemHealthMonitor(self.memory_manager)
-
-        # Conditionally initialize prompt handlers based on server mode
-        if server_mode in ["full", "prompts-only"]:
-            self.prompt_handlers = PromptHandlers(self.memory_manager)
-            logger.info("Prompt handlers initialized")
-        else:
-            self.prompt_handlers = None
-            logger.info("Prompt handlers disabled (tools-only mode)")
+        try:
+            manager = QdrantMemoryManager()
+            logger.info("Memory manager initialized")
+            return manager
+        except Exception as e:
+            logger.error(f"Failed to initialize memory manager: {e}")
+            return None
+
+    @cached_property
+    def tool_handlers(self) -> ToolHandlers:
+        return ToolHandlers(self.memory_manager)
+
+    @cached_property
+    def resource_handlers(self) -> ResourceHandlers:
+        return ResourceHandlers(self.memory_manager)
 
-        logger.info("Memory MCP Server initialized")
+    @cached_property
+    def health_monitor(self) -> SystemHealthMonitor:
+        return SystemHealthMonitor(self.memory_manager)
+
+    @cached_property
+    def prompt_handlers(self) -> Optional[PromptHandlers]:
+        """Prompt handlers; None in tools-only mode."""
+        if self.server_mode in ["full", "prompts-only"]:
+            logger.info("Prompt handlers initialized")
+            return PromptHandlers(self.memory_manager)
+        logger.info("Prompt handlers disabled (tools-only mode)")
+        return None
 
     def get_system_health(self) -> Dict[str, Any]:
         """Get comprehensive system health information."""
@@ -109,7 +154,7 @@ class MemoryMCPServer:
             resource_data = result.get("data", {})
 
             # Convert the data to a properly formatted JSON string
-            json_text = json.dumps(resource_data, indent=2, ensure_ascii=False)
+            json_text = _dumps(resource_data)
 
             return {
                 "contents": [
@@ -126,6 +171,32 @@ class MemoryMCPServer:
                 }
             }
 
+    async def handle_resource_reads(
+        self,
+        requests: List[tuple],
+        max_concurrency: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """Read several resources concurrently.
+
+        Each request is a (uri, params) pair; the reads are dispatched
+        together under a semaphore-bounded window instead of awaiting
+        one round-trip at a time, so N reads cost roughly the slowest
+        one. Results come back in request order, each shaped like a
+        handle_resource_read response (per-read failures surface as
+        that read's error dict, not as an exception for the batch).
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _read_one(uri: str, params: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.handle_resource_read(uri, params)
+
+        return list(
+            await asyncio.gather(
+                *(_read_one(uri, params) for uri, params in requests)
+            )
+        )
+
     def get_available_prompts(self) -> List[Dict[str, Any]]:
         """Get list of available prompts."""
         # Return empty list in tools-only mode or if components not available
@@ -184,13 +255,15 @@ class MemoryMCPServer:
                 if isinstance(content_blocks, str):
                     guidance_text = content_blocks.strip()
                 elif isinstance(content_blocks, list):
-                    text_parts = []
-                    for block in content_blocks:
-                        if isinstance(block, dict) and block.get("type") == "text":
-                            text_value = str(block.get("text", "")).strip()
-                            if text_value:
-                                text_parts.append(text_value)
-                    guidance_text = "\n\n".join(text_parts)
+                    # type(...) is dict is a single pointer compare (no
+                    # subclasses arrive here); join over a generator
+                    # skips the intermediate parts list
+                    guidance_text = "\n\n".join(
+                        text_value
+                        for block in content_blocks
+                        if type(block) is dict and block.get("type") == "text"
+                        and (text_value := str(block.get("text", "")).strip())
+                    )
 
             if not guidance_text:
                 guidance_text = "No reference content available for this prompt."
@@ -85,7 +85,7 @@ class AgentRegistry:
             # Store in agent registry
             point = PointStruct(
                 id=self._agent_id_to_point_id(agent_id),
-                vector=embedding,
+                vector=embedding.tolist(),
                 payload=agent_metadata
             )
 
@@ -161,7 +161,7 @@ class AgentRegistry:
             # Update in registry
             point = PointStruct(
                 id=self._agent_id_to_point_id(agent_id),
-                vector=embedding,
+                vector=embedding.tolist(),
                 payload=agent_data
             )
 
@@ -276,7 +276,7 @@ class AgentRegistry:
                     }
                 )
 
-            logger.info(f"📝 Logged action for agent {agent_id}: {action}")
+            logger.info("📝 Logged action for agent %s: %s", agent_id, action)
             return {
                 "success": True,
                 "message": "Action logged successfully",
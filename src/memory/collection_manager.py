@@ -10,6 +10,7 @@ import logging
 from typing import List
 from qdrant_client import QdrantClient
 from qdrant_client.models import Distance, VectorParams
+from ..collection_manager import default_quantization_config
 from ..config import Config
 
 logger = logging.getLogger(__name__)
@@ -43,7 +44,8 @@ class CollectionManager:
                         vectors_config=VectorParams(
                             size=Config.EMBEDDING_DIMENSION,
                             distance=Distance.COSINE
-                        )
+                        ),
+                        quantization_config=default_quantization_config()
                     )
                     logger.info(f"✅ Created legacy collection: {collection_name}")
                 else:
@@ -75,7 +77,8 @@ class CollectionManager:
                         vectors_config=VectorParams(
                             size=Config.EMBEDDING_DIMENSION,
                             distance=Distance.COSINE
-                        )
+                        ),
+                        quantization_config=default_quantization_config()
                     )
                     logger.info(f"✅ Created collection: {collection_name}")
                 else:
@@ -110,7 +113,8 @@ class CollectionManager:
                         vectors_config=VectorParams(
                             size=Config.EMBEDDING_DIMENSION,
                             distance=Distance.COSINE
-                        )
+                        ),
+                        quantization_config=default_quantization_config()
                     )
                     logger.info(f"✅ Created collection: {collection_name}")
                 else:
@@ -138,7 +142,8 @@ class CollectionManager:
                     vectors_config=VectorParams(
                         size=Config.EMBEDDING_DIMENSION,
                         distance=Distance.COSINE
-                    )
+                    ),
+                    quantization_config=default_quantization_config()
                 )
                 logger.info(f"✅ Created agent collection: {collection_name}")
             
@@ -5,16 +5,203 @@ This module handles text embedding generation and content hashing,
 extracted from the monolithic memory_manager.py for better separation of concerns.
 """
 
+import functools
 import hashlib
 import logging
+import os
 import uuid
-from typing import List
+from typing import List, Optional
+
+import numpy as np
+
+# Let the Rust tokenizer parallelize batch tokenization instead of
+# disabling itself after fork (only a default — deployments can still
+# override via the environment)
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
 from sentence_transformers import SentenceTransformer
+
 from ..config import Config
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def content_uuid(content: str) -> str:
+    """Deterministic UUID-format ID for content, memoized.
+
+    Qdrant only accepts UUID-format strings or unsigned 64-bit integers
+    as point IDs. A 16-byte blake2b digest (SIMD-accelerated, faster
+    than the SHA-1 pass uuid5 made over large contents) is formatted
+    directly as a UUID, so the same content always maps to the same ID.
+    Dedup scans hash the same candidates repeatedly, so the result is
+    memoized with a bounded LRU.
+    """
+    digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+    return str(uuid.UUID(bytes=digest))
+
+
+class OnnxEmbeddingModel:
+    """SentenceTransformer-compatible encoder backed by ONNX Runtime.
+
+    ONNX Runtime runs the exported transformer graph with operator fusion,
+    typically 2-4x faster than PyTorch eager on CPU for MiniLM-class
+    models. Only the encode() subset used by this codebase is provided.
+    """
+
+    def __init__(self, model_name: str):
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+
+        if "/" not in model_name:
+            model_name = f"sentence-transformers/{model_name}"
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.model = self._load_int8(model_name) or (
+            ORTModelForFeatureExtraction.from_pretrained(model_name, export=True)
+        )
+
+    @staticmethod
+    def _load_int8(model_name: str):
+        """Load a dynamically INT8-quantized model, quantizing on first use.
+
+        INT8 dynamic quantization halves the weight bytes again over ONNX
+        FP32 and uses the CPU's int8 dot-product instructions, with
+        negligible recall impact for MiniLM-class retrieval. The quantized
+        artifact is cached on disk so later cold starts skip the export
+        and quantization passes. Returns None on any failure so the
+        caller falls back to the plain FP32 ONNX export.
+        """
+        from pathlib import Path
+
+        try:
+            from optimum.onnxruntime import (
+                ORTModelForFeatureExtraction,
+                ORTQuantizer,
+            )
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+            cache_dir = (
+                Path.home()
+                / ".cache"
+                / "qdrant_memory_mcp"
+                / f"{model_name.replace('/', '--')}-int8"
+            )
+            if not (cache_dir / "model_quantized.onnx").is_file():
+                model = ORTModelForFeatureExtraction.from_pretrained(
+                    model_name, export=True
+                )
+                quantizer = ORTQuantizer.from_pretrained(model)
+                quantizer.quantize(
+                    save_dir=cache_dir,
+                    quantization_config=AutoQuantizationConfig.avx512_vnni(
+                        is_static=False
+                    ),
+                )
+            return ORTModelForFeatureExtraction.from_pretrained(
+                cache_dir, file_name="model_quantized.onnx"
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ INT8 quantization unavailable ({e}); using FP32 ONNX")
+            return None
+
+    def encode(self, sentences, batch_size: int = 32, **_kwargs):
+        """Mean-pooled embeddings, mirroring SentenceTransformer.encode."""
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+
+        batches = []
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
+            tokens = self.tokenizer(
+                batch, padding=True, truncation=True, return_tensors="np"
+            )
+            hidden = np.asarray(self.model(**tokens).last_hidden_state)
+            mask = np.expand_dims(tokens["attention_mask"], -1).astype(
+                hidden.dtype
+            )
+            batches.append(
+                (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            )
+
+        embeddings = np.concatenate(batches, axis=0)
+        return embeddings[0] if single else embeddings
+
+
+def _embedding_device() -> str:
+    """Resolve the torch device for embedding, preferring CUDA when present."""
+    if Config.EMBEDDING_DEVICE:
+        return Config.EMBEDDING_DEVICE
+
+    import torch
+
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def create_embedding_model(model_name: str):
+    """Load the embedding model for the configured backend.
+
+    With EMBEDDING_BACKEND=onnx (and optimum[onnxruntime] installed) the
+    model runs under ONNX Runtime; anything else — including a failed
+    optimum import — falls back to the standard SentenceTransformer. The
+    PyTorch model lands on the GPU automatically when one is available
+    (override with EMBEDDING_DEVICE).
+    """
+    if Config.EMBEDDING_BACKEND == "onnx":
+        try:
+            model = OnnxEmbeddingModel(model_name)
+            logger.info(f"✅ Loaded ONNX embedding model: {model_name}")
+            return model
+        except ImportError as e:
+            logger.warning(
+                f"⚠️ ONNX embedding backend requested but unavailable ({e}); "
+                "falling back to PyTorch"
+            )
+    device = _embedding_device()
+    if device != "cpu":
+        logger.info(f"✅ Embedding model running on {device}")
+    model = SentenceTransformer(model_name, device=device)
+    # Guard against ending up on the pure-Python slow tokenizer (5-10x
+    # slower on batches than the Rust-backed fast one)
+    tokenizer = getattr(model, "tokenizer", None)
+    if tokenizer is not None and not getattr(tokenizer, "is_fast", True):
+        try:
+            from transformers import AutoTokenizer
+
+            model.tokenizer = AutoTokenizer.from_pretrained(
+                model_name, use_fast=True
+            )
+            logger.info("✅ Switched to fast tokenizer for %s", model_name)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not load fast tokenizer: {e}")
+    # Attention cost is quadratic in sequence length; memories are short,
+    # so a tighter cap than the model's 256 default is free throughput
+    model.max_seq_length = Config.EMBEDDING_MAX_SEQ_LENGTH
+    if device.startswith("cuda"):
+        # FP16 halves VRAM traffic and engages tensor cores; MiniLM
+        # cosine retrieval is insensitive to the precision loss. TF32
+        # covers any matmuls that stay in float32.
+        import torch
+
+        torch.backends.cuda.matmul.allow_tf32 = True
+        model.half()
+    if Config.EMBEDDING_TORCH_COMPILE:
+        # Compile just the underlying transformer; SentenceTransformer's
+        # tokenize/pool wrapper stays eager. Failures (old torch, missing
+        # compiler toolchain) leave the eager model in place.
+        try:
+            import torch
+
+            transformer = model._first_module()
+            transformer.auto_model = torch.compile(
+                transformer.auto_model, mode="reduce-overhead", dynamic=True
+            )
+            logger.info("✅ torch.compile enabled for embedding model")
+        except Exception as e:
+            logger.warning(f"⚠️ torch.compile unavailable ({e}); staying eager")
+    return model
+
+
 class EmbeddingService:
     """Service for handling text embeddings and content processing."""
 
@@ -26,43 +213,101 @@ class EmbeddingService:
         """Initialize the embedding model."""
         try:
             # Initialize embedding model
-            self.embedding_model = SentenceTransformer(Config.EMBEDDING_MODEL)
+            self.embedding_model = create_embedding_model(Config.EMBEDDING_MODEL)
             logger.info(f"✅ Loaded embedding model: {Config.EMBEDDING_MODEL}")
         except Exception as e:
             logger.error(f"❌ Failed to initialize embedding model: {e}")
             raise
 
-    def _embed_text(self, text: str) -> List[float]:
-        """Generate embeddings for text content."""
+    def embed_texts(
+        self, texts: List[str], batch_size: Optional[int] = None
+    ) -> np.ndarray:
+        """Embed a batch of texts in one encoder forward pass.
+
+        One batched encode amortizes tokenization and model overhead
+        across all texts; callers that loop over documents should
+        collect them and call this once. Returns a float32 matrix with
+        one row per text — stays numpy internally, convert at the
+        client boundary only where required.
+        """
         if not self.embedding_model:
             raise ValueError("Embedding model not initialized")
 
         try:
-            # Generate embeddings
-            embedding = self.embedding_model.encode(text)
-            return embedding.tolist()
+            return np.asarray(
+                self.embedding_model.encode(
+                    texts,
+                    batch_size=batch_size or Config.EMBEDDING_BATCH_SIZE,
+                    show_progress_bar=False,
+                ),
+                dtype=np.float32,
+            )
         except Exception as e:
-            logger.error(f"❌ Failed to generate embedding: {e}")
+            logger.error(f"❌ Failed to generate embeddings: {e}")
             raise
 
+    def cosine_similarities(
+        self, query: np.ndarray, corpus: np.ndarray
+    ) -> np.ndarray:
+        """Cosine similarity of one query vector against a corpus matrix.
+
+        One BLAS mat-vec over the whole corpus instead of a Python loop
+        of pairwise comparisons — this is what dedup scans should call
+        when checking a candidate against many stored embeddings.
+        """
+        q = np.asarray(query, dtype=np.float32)
+        matrix = np.ascontiguousarray(corpus, dtype=np.float32)
+        q = q / (np.linalg.norm(q) or 1.0)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.maximum(norms, 1e-12, out=norms)
+        return (matrix / norms) @ q
+
+    def top_k_similar(
+        self,
+        query: np.ndarray,
+        corpus: np.ndarray,
+        k: int,
+        min_score: float = 0.0,
+    ) -> List[tuple]:
+        """Indices and scores of the k most similar corpus rows.
+
+        Uses argpartition for the candidate set (O(n) instead of a full
+        sort), then orders just the k winners. Rows below min_score are
+        dropped.
+        """
+        sims = self.cosine_similarities(query, corpus)
+        if k < len(sims):
+            candidates = np.argpartition(sims, -k)[-k:]
+        else:
+            candidates = np.arange(len(sims))
+        order = candidates[np.argsort(sims[candidates])[::-1]]
+        return [
+            (int(i), float(sims[i])) for i in order if sims[i] >= min_score
+        ]
+
+    def _embed_text(self, text: str) -> np.ndarray:
+        """Generate embedding for text content as a float32 array.
+
+        The contiguous numpy buffer is ~30x smaller than a list of boxed
+        Python floats and is accepted directly by qdrant-client query
+        vectors; callers convert with .tolist() only where PointStruct
+        requires a list.
+        """
+        return self.embed_texts([text])[0]
+
     def _generate_content_hash(self, content: str) -> str:
         """Generate a deterministic UUID for content to use as Qdrant point ID.
 
-        Qdrant only accepts UUID-format strings or unsigned 64-bit integers as
-        point IDs.  We use uuid5 (SHA-1 based, deterministic) so the same
-        content always maps to the same ID, preserving deduplication semantics.
-
-        The namespace UUID matches GenericMemoryService._generate_content_hash
-        so both code paths produce identical IDs for the same content.
+        Delegates to the memoized module-level content_uuid so the scheme
+        stays in one place for every code path.
         """
         try:
-            namespace = uuid.UUID("12345678-1234-5678-1234-123456789abc")
-            return str(uuid.uuid5(namespace, content))
+            return content_uuid(content)
         except Exception as e:
             logger.error(f"❌ Failed to generate content hash: {e}")
             raise
 
-    def embed_text(self, text: str) -> List[float]:
+    def embed_text(self, text: str) -> np.ndarray:
         """Public interface for text embedding."""
         return self._embed_text(text)
 
@@ -57,7 +57,7 @@ class FileMetadataManager:
             # Use file hash as point ID for easy retrieval
             point = PointStruct(
                 id=file_hash,
-                vector=embedding,
+                vector=embedding.tolist(),
                 payload=metadata
             )
 
@@ -66,7 +66,7 @@ class FileMetadataManager:
                 points=[point]
             )
 
-            logger.info(f"📄 Added metadata for file: {file_path}")
+            logger.info("📄 Added metadata for file: %s", file_path)
             return {
                 "success": True,
                 "file_path": file_path,
@@ -154,7 +154,7 @@ class FileMetadataManager:
             # Update point
             point = PointStruct(
                 id=file_hash,
-                vector=embedding,
+                vector=embedding.tolist(),
                 payload=metadata
             )
             
@@ -163,7 +163,9 @@ class FileMetadataManager:
                 points=[point]
             )
             
-            logger.info(f"📄 Updated status for file hash {file_hash}: {status}")
+            logger.info(
+                "📄 Updated status for file hash %s: %s", file_hash, status
+            )
             return {
                 "success": True,
                 "file_hash": file_hash,
@@ -212,7 +214,7 @@ class FileMetadataManager:
                 points_selector=[file_hash]
             )
             
-            logger.info(f"🗑️ Deleted metadata for file hash: {file_hash}")
+            logger.info("🗑️ Deleted metadata for file hash: %s", file_hash)
             return {
                 "success": True,
                 "deleted_hash": file_hash
@@ -53,7 +53,7 @@ class VectorOperations:
             # Create point
             point = PointStruct(
                 id=content_hash,
-                vector=embedding,
+                vector=embedding.tolist(),
                 payload=full_metadata
             )
             
@@ -63,7 +63,7 @@ class VectorOperations:
                 points=[point]
             )
             
-            logger.info(f"✅ Added content to {collection}")
+            logger.info("✅ Added content to %s", collection)
             return {
                 "success": True,
                 "content_hash": content_hash,
@@ -123,7 +123,9 @@ class VectorOperations:
                                if k != "content"}
                 })
             
-            logger.info(f"🔍 Found {len(formatted_results)} results in {collection}")
+            logger.info(
+                "🔍 Found %d results in %s", len(formatted_results), collection
+            )
             return {
                 "success": True,
                 "results": formatted_results,
@@ -237,7 +239,7 @@ class VectorOperations:
                 points_selector=[content_hash]
             )
             
-            logger.info(f"🗑️ Deleted content from {collection}")
+            logger.info("🗑️ Deleted content from %s", collection)
             return {
                 "success": True,
                 "deleted_id": content_hash,
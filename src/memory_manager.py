@@ -26,10 +26,28 @@ from .memory import (
     EmbeddingService,
     CollectionManager
 )
+from .memory.embedding_service import create_embedding_model
 
 logger = logging.getLogger(__name__)
 
 
+def qdrant_client_kwargs() -> Dict[str, Any]:
+    """Build the connection kwargs shared by sync and async Qdrant clients."""
+    client_kwargs: Dict[str, Any] = {
+        "host": Config.QDRANT_HOST,
+        "port": Config.QDRANT_PORT,
+        "timeout": 60,
+    }
+    if Config.QDRANT_API_KEY:
+        client_kwargs["api_key"] = Config.QDRANT_API_KEY
+    if Config.QDRANT_PREFER_GRPC:
+        # gRPC keeps a multiplexed HTTP/2 channel warm across calls,
+        # avoiding per-request connection setup on the REST transport
+        client_kwargs["prefer_grpc"] = True
+        client_kwargs["grpc_port"] = Config.QDRANT_GRPC_PORT
+    return client_kwargs
+
+
 class QdrantMemoryManager:
     """
     Lightweight router that delegates to specialized memory modules.
@@ -114,19 +132,7 @@ class QdrantMemoryManager:
     def _fallback_sync_init(self) -> None:
         """Fallback to sync initialization with modular services."""
         # Initialize Qdrant client directly
-        if Config.QDRANT_API_KEY:
-            self.client = QdrantClient(
-                host=Config.QDRANT_HOST,
-                port=Config.QDRANT_PORT,
-                api_key=Config.QDRANT_API_KEY,
-                timeout=60
-            )
-        else:
-            self.client = QdrantClient(
-                host=Config.QDRANT_HOST,
-                port=Config.QDRANT_PORT,
-                timeout=60
-            )
+        self.client = QdrantClient(**qdrant_client_kwargs())
 
         # Test connection
         collections = self.client.get_collections()
@@ -139,7 +145,7 @@ class QdrantMemoryManager:
         )
 
         # Initialize embedding model
-        self.embedding_model = SentenceTransformer(Config.EMBEDDING_MODEL)
+        self.embedding_model = create_embedding_model(Config.EMBEDDING_MODEL)
         logger.info(f"✅ Loaded embedding model: {Config.EMBEDDING_MODEL}")
 
         # Initialize specialized modules
@@ -207,7 +213,7 @@ class QdrantMemoryManager:
             "description": description,
             "timestamp": datetime.now().isoformat()
         }
-        logger.info(f"🎯 Set agent context: {agent_id} ({context_type})")
+        logger.info("🎯 Set agent context: %s (%s)", agent_id, context_type)
 
     def add_to_global_memory(
         self,
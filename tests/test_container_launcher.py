@@ -0,0 +1,135 @@
+"""
+Unit tests for the container launcher's docker plumbing.
+
+Covers the docker client version probe behind the pull-flag choice and
+the Engine API socket client's status handling — all against fakes, no
+docker daemon needed.
+"""
+
+import subprocess
+
+import pytest
+
+from src import mcp_container_launcher as launcher
+from src.mcp_container_launcher import DockerSocketClient
+
+
+def _completed(stdout: str) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(["docker"], 0, stdout=stdout, stderr="")
+
+
+@pytest.fixture(autouse=True)
+def _clear_probe_caches():
+    """Both probes are lru_cached; keep tests independent."""
+    launcher._docker_pull_flag.cache_clear()
+    yield
+    launcher._docker_pull_flag.cache_clear()
+
+
+@pytest.fixture
+def docker_version(monkeypatch):
+    """Patch the version probe to return a given `docker version` stdout."""
+
+    def _set(stdout: str):
+        monkeypatch.setattr(launcher, "_docker_bin", lambda: "/usr/bin/docker")
+        monkeypatch.setattr(
+            launcher, "run_command", lambda *a, **k: _completed(stdout)
+        )
+
+    return _set
+
+
+class TestDockerPullFlag:
+    """Version parsing behind the --pull flag spelling."""
+
+    def test_modern_client_uses_pull_always(self, docker_version):
+        docker_version("28.0.1\n")
+        assert launcher._docker_pull_flag() == ("--pull", "always")
+
+    def test_19_03_boundary(self, docker_version):
+        docker_version("19.03.13")
+        assert launcher._docker_pull_flag() == ("--pull", "always")
+
+    def test_old_client_uses_legacy_spelling(self, docker_version):
+        docker_version("18.09.7")
+        assert launcher._docker_pull_flag() == ("--pull-always",)
+
+    def test_unparseable_version_defaults_to_modern(self, docker_version):
+        docker_version("dev")
+        assert launcher._docker_pull_flag() == ("--pull", "always")
+
+    def test_empty_output_defaults_to_modern(self, docker_version):
+        docker_version("")
+        assert launcher._docker_pull_flag() == ("--pull", "always")
+
+    def test_probe_runs_once(self, monkeypatch):
+        calls = []
+
+        def probe(*args, **kwargs):
+            calls.append(args)
+            return _completed("28.0.1")
+
+        monkeypatch.setattr(launcher, "_docker_bin", lambda: "/usr/bin/docker")
+        monkeypatch.setattr(launcher, "run_command", probe)
+
+        launcher._docker_pull_flag()
+        launcher._docker_pull_flag()
+        assert len(calls) == 1
+
+
+class TestDockerSocketClient:
+    """Engine API status handling (request layer stubbed out)."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        socket_client = DockerSocketClient()
+        monkeypatch.setattr(socket_client, "available", lambda: True)
+        return socket_client
+
+    def _stub_reply(self, client, reply):
+        client._request = lambda method, path: reply
+
+    def test_start_container_started(self, client):
+        self._stub_reply(client, (204, b""))
+        assert client.start_container("qdrant") is True
+
+    def test_start_container_already_running(self, client):
+        self._stub_reply(client, (304, b""))
+        assert client.start_container("qdrant") is True
+
+    def test_start_container_missing(self, client):
+        self._stub_reply(client, (404, b""))
+        assert client.start_container("qdrant") is False
+
+    def test_start_container_server_error_is_unknowable(self, client):
+        self._stub_reply(client, (500, b"oops"))
+        assert client.start_container("qdrant") is None
+
+    def test_start_container_socket_failure_is_unknowable(self, client):
+        self._stub_reply(client, None)
+        assert client.start_container("qdrant") is None
+
+    def test_container_running_true(self, client):
+        self._stub_reply(client, (200, b'{"State": {"Running": true}}'))
+        assert client.container_running("qdrant") is True
+
+    def test_container_running_false(self, client):
+        self._stub_reply(client, (200, b'{"State": {"Running": false}}'))
+        assert client.container_running("qdrant") is False
+
+    def test_container_running_missing(self, client):
+        self._stub_reply(client, (404, b"no such container"))
+        assert client.container_running("qdrant") is None
+
+    def test_container_running_bad_json(self, client):
+        self._stub_reply(client, (200, b"not json"))
+        assert client.container_running("qdrant") is None
+
+    def test_unavailable_socket_short_circuits(self, tmp_path):
+        socket_client = DockerSocketClient(
+            socket_path=str(tmp_path / "missing.sock")
+        )
+        assert socket_client.available() is False
+        assert socket_client._request("GET", "/containers/qdrant/json") is None
+        assert socket_client.container_running("qdrant") is None
+        assert socket_client.start_container("qdrant") is None
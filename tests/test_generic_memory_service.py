@@ -0,0 +1,246 @@
+"""
+Unit tests for GenericMemoryService bulk-add and search logic.
+
+Exercises bulk ingestion (validation, ID/payload construction, wait
+plumbing), the bounded-heap result merge, batch search, and the
+semantic query cache with mocked Qdrant clients and a fake embedding
+model — no running Qdrant needed.
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+from src.generic_memory_service import GenericMemoryService
+from src.memory.embedding_service import content_uuid
+
+
+class FakeHit:
+    """Stand-in for a qdrant-client scored point."""
+
+    def __init__(self, score, payload=None, hit_id="hit"):
+        self.id = hit_id
+        self.score = score
+        self.payload = payload if payload is not None else {}
+
+
+def _fake_encode(texts, **_kwargs):
+    if isinstance(texts, str):
+        return np.ones(4, dtype=np.float32)
+    return np.ones((len(texts), 4), dtype=np.float32)
+
+
+@pytest.fixture
+def service():
+    """GenericMemoryService wired to mocks, bypassing initialize()."""
+    svc = GenericMemoryService()
+    svc.initialized = True
+    svc.collection_manager = MagicMock()
+    model = MagicMock()
+    model.device = "cpu"
+    model.encode.side_effect = _fake_encode
+    svc.embedding_model = model
+    svc.client = MagicMock()
+    svc._get_collection_cached = lambda name: {"success": True}
+    return svc
+
+
+class TestAddMemoriesBulk:
+    """Validation, payload construction, and plumbing of the bulk add."""
+
+    async def test_rejects_empty_items(self, service):
+        result = await service.add_memories_bulk("docs", [])
+        assert result["success"] is False
+        assert "No items" in result["error"]
+
+    async def test_requires_initialization(self):
+        svc = GenericMemoryService()
+        result = await svc.add_memories_bulk("docs", [{"content": "x"}])
+        assert result["success"] is False
+        assert "not initialized" in result["error"]
+
+    async def test_unknown_collection(self, service):
+        service._get_collection_cached = lambda name: {"success": False}
+        result = await service.add_memories_bulk("nope", [{"content": "x"}])
+        assert result["success"] is False
+        assert "not found" in result["error"]
+
+    async def test_builds_ids_and_payloads(self, service):
+        items = [
+            {"content": "alpha", "metadata": {"source": "test"}, "tags": ["t1"]},
+            {"content": "beta"},
+        ]
+        result = await service.add_memories_bulk("docs", items)
+
+        assert result["success"] is True
+        assert result["count"] == 2
+        # IDs are the deterministic content UUIDs
+        assert result["memory_ids"] == [content_uuid("alpha"), content_uuid("beta")]
+
+        batch = service.client.upsert.call_args.kwargs["points"]
+        assert batch.ids == result["memory_ids"]
+        first, second = batch.payloads
+        assert first["content"] == "alpha"
+        assert first["content_len"] == len("alpha")
+        assert first["collection"] == "docs"
+        assert first["source"] == "test"
+        assert first["tags"] == ["t1"]
+        assert second["tags"] == []
+        assert first["timestamp"] == second["timestamp"]
+
+    async def test_wait_flag_is_plumbed_through(self, service):
+        await service.add_memories_bulk("docs", [{"content": "x"}], wait=True)
+        assert service.client.upsert.call_args.kwargs["wait"] is True
+
+        await service.add_memories_bulk("docs", [{"content": "y"}])
+        assert service.client.upsert.call_args.kwargs["wait"] is False
+
+    async def test_caller_metadata_is_not_mutated(self, service):
+        metadata = {"source": "test"}
+        await service.add_memories_bulk(
+            "docs", [{"content": "x", "metadata": metadata}]
+        )
+        assert metadata == {"source": "test"}
+
+    async def test_duplicate_contents_skip_the_encoder(self, service):
+        items = [{"content": "a"}, {"content": "b"}]
+        await service.add_memories_bulk("docs", items)
+        assert service.embedding_model.encode.call_count == 1
+
+        # Same contents again: every embedding comes from the LRU
+        await service.add_memories_bulk("docs", items)
+        assert service.embedding_model.encode.call_count == 1
+
+        # A new content encodes only the miss
+        await service.add_memories_bulk("docs", [{"content": "a"}, {"content": "c"}])
+        assert service.embedding_model.encode.call_count == 2
+        (encoded,), _ = service.embedding_model.encode.call_args
+        assert encoded == ["c"]
+
+
+class TestBulkAddLegacy:
+    """Legacy-collection bulk loader."""
+
+    def test_rejects_unknown_collection_key(self, service):
+        result = service.bulk_add_legacy("bogus", [{"content": "x"}])
+        assert result["success"] is False
+        assert "Unknown legacy collection" in result["error"]
+
+    def test_rejects_empty_items(self, service):
+        result = service.bulk_add_legacy("global", [])
+        assert result["success"] is False
+
+    def test_uploads_ids_and_payloads(self, service):
+        result = service.bulk_add_legacy(
+            "global", [{"content": "alpha", "metadata": {"category": "general"}}]
+        )
+        assert result["success"] is True
+
+        kwargs = service.client.upload_collection.call_args.kwargs
+        assert kwargs["ids"] == [content_uuid("alpha")]
+        payload = kwargs["payload"][0]
+        assert payload["content"] == "alpha"
+        assert payload["content_len"] == len("alpha")
+        assert payload["category"] == "general"
+
+
+class TestSearchMerge:
+    """Bounded-heap merge in the sync search path."""
+
+    def test_merges_top_k_across_collections(self, service):
+        hits = {
+            "c1": [FakeHit(0.9, {"content": "c1-a"}), FakeHit(0.2, {"content": "c1-b"})],
+            "c2": [FakeHit(0.7, {"content": "c2-a"}), FakeHit(0.5, {"content": "c2-b"})],
+            "c3": [FakeHit(0.8, {"content": "c3-a"})],
+        }
+        service.client.search.side_effect = (
+            lambda collection_name, **_: hits[collection_name]
+        )
+
+        result = service._search_memory_sync(["c1", "c2", "c3"], "q", limit=3)
+
+        assert result["success"] is True
+        assert result["total_results"] == 5
+        scores = [hit["score"] for hit in result["results"]]
+        assert scores == [0.9, 0.8, 0.7]
+        assert result["results"][0]["content"] == "c1-a"
+
+    def test_score_ties_do_not_compare_payloads(self, service):
+        # Equal scores force the heap to its tie-breaker; payload dicts
+        # are not orderable, so this would raise without it
+        service.client.search.side_effect = lambda collection_name, **_: [
+            FakeHit(0.5, {"content": f"{collection_name}-a"}),
+            FakeHit(0.5, {"content": f"{collection_name}-b"}),
+        ]
+        result = service._search_memory_sync(["c1", "c2"], "q", limit=3)
+        assert result["success"] is True
+        assert len(result["results"]) == 3
+
+    def test_failing_collection_is_skipped(self, service):
+        def search(collection_name, **_):
+            if collection_name == "broken":
+                raise RuntimeError("boom")
+            return [FakeHit(0.6, {"content": "ok"})]
+
+        service.client.search.side_effect = search
+        result = service._search_memory_sync(["broken", "good"], "q", limit=5)
+
+        assert result["success"] is True
+        assert result["total_results"] == 1
+        assert result["results"][0]["content"] == "ok"
+
+
+class TestSearchMemoryBatch:
+    """Batched multi-query search."""
+
+    def test_one_encode_for_all_queries(self, service):
+        service.client.search.return_value = [FakeHit(0.9, {"content": "x"})]
+        responses = service._search_memory_batch_sync(
+            ["c1", "c2"], ["q1", "q2", "q3"], limit=5
+        )
+
+        assert service.embedding_model.encode.call_count == 1
+        assert [r["query"] for r in responses] == ["q1", "q2", "q3"]
+        for response in responses:
+            assert response["success"] is True
+            assert response["total_results"] == 2
+
+    def test_embedding_failure_fails_every_query(self, service):
+        service.embedding_model.encode.side_effect = RuntimeError("model gone")
+        responses = service._search_memory_batch_sync(["c1"], ["q1", "q2"])
+        assert len(responses) == 2
+        assert all(r["success"] is False for r in responses)
+
+
+class TestSemanticQueryCache:
+    """Semantic cache hits and write-path invalidation."""
+
+    @pytest.fixture
+    def search_service(self, service):
+        # No async client: search_memory falls back to the sync client
+        service.aclient = None
+        service.client.search.return_value = [FakeHit(0.9, {"content": "x"})]
+        return service
+
+    async def test_repeat_query_skips_the_fanout(self, search_service):
+        first = await search_service.search_memory("q", collections=["c1"])
+        assert first["success"] is True
+        assert search_service.client.search.call_count == 1
+
+        second = await search_service.search_memory("q", collections=["c1"])
+        assert second == first
+        assert search_service.client.search.call_count == 1
+
+    async def test_filters_bypass_the_cache(self, search_service):
+        await search_service.search_memory("q", collections=["c1"], filters={"a": 1})
+        await search_service.search_memory("q", collections=["c1"], filters={"a": 1})
+        assert search_service.client.search.call_count == 2
+
+    async def test_write_invalidates_cached_results(self, search_service):
+        await search_service.search_memory("q", collections=["c1"])
+        assert search_service.client.search.call_count == 1
+
+        await search_service.add_memories_bulk("c1", [{"content": "new"}])
+
+        await search_service.search_memory("q", collections=["c1"])
+        assert search_service.client.search.call_count == 2
@@ -0,0 +1,128 @@
+"""
+Unit tests for the table-driven YAML config loader.
+
+Exercises the _YAML_FIELDS mapping in ConfigManager: value routing to
+the top-level config and its sub-objects, enum conversions, and that
+unknown or absent sections leave defaults untouched.
+"""
+
+import pytest
+
+from src.server_config import (
+    ConfigManager,
+    LogLevel,
+    QdrantMode,
+    ServerConfig,
+)
+
+
+@pytest.fixture
+def manager():
+    """ConfigManager with defaults only — __init__ is bypassed so env
+    vars on the host machine cannot leak into these tests."""
+    instance = ConfigManager.__new__(ConfigManager)
+    instance.config = ServerConfig()
+    return instance
+
+
+class TestYamlFieldTable:
+    """_update_config_from_dict routing through _YAML_FIELDS."""
+
+    def test_top_level_server_fields(self, manager):
+        manager._update_config_from_dict(
+            {"server": {"name": "custom", "version": "2.0.0"}}
+        )
+        assert manager.config.name == "custom"
+        assert manager.config.version == "2.0.0"
+
+    def test_log_level_is_converted_case_insensitively(self, manager):
+        manager._update_config_from_dict({"logging": {"level": "debug"}})
+        assert manager.config.log_level is LogLevel.DEBUG
+
+    def test_qdrant_fields_land_on_the_sub_config(self, manager):
+        manager._update_config_from_dict(
+            {
+                "qdrant": {
+                    "mode": "remote",
+                    "host": "qdrant.internal",
+                    "port": 7000,
+                }
+            }
+        )
+        assert manager.config.qdrant.mode is QdrantMode.REMOTE
+        assert manager.config.qdrant.host == "qdrant.internal"
+        assert manager.config.qdrant.port == 7000
+        # Keys the YAML did not mention keep their defaults
+        assert manager.config.qdrant.timeout == 60
+
+    def test_embedding_fields_land_on_the_sub_config(self, manager):
+        manager._update_config_from_dict(
+            {"embedding": {"model_name": "all-mpnet-base-v2", "device": "cuda"}}
+        )
+        assert manager.config.embedding.model_name == "all-mpnet-base-v2"
+        assert manager.config.embedding.device == "cuda"
+
+    def test_unknown_sections_and_keys_are_ignored(self, manager):
+        defaults = ServerConfig()
+        manager._update_config_from_dict(
+            {
+                "unknown_section": {"foo": "bar"},
+                "server": {"unmapped_key": "value"},
+            }
+        )
+        assert manager.config.name == defaults.name
+        assert manager.config.version == defaults.version
+
+    def test_empty_data_is_a_no_op(self, manager):
+        defaults = ServerConfig()
+        manager._update_config_from_dict({})
+        assert manager.config.name == defaults.name
+        assert manager.config.log_level is defaults.log_level
+        assert manager.config.qdrant.host == defaults.qdrant.host
+
+    def test_empty_section_is_a_no_op(self, manager):
+        manager._update_config_from_dict({"qdrant": None, "logging": {}})
+        assert manager.config.qdrant.port == 6333
+        assert manager.config.log_level is LogLevel.INFO
+
+    def test_bad_enum_value_raises(self, manager):
+        with pytest.raises(ValueError):
+            manager._update_config_from_dict({"qdrant": {"mode": "bogus"}})
+
+
+class TestYamlFileLoading:
+    """End-to-end load through a real YAML file."""
+
+    def test_yaml_file_overrides_defaults(self, tmp_path, monkeypatch):
+        # Drop env overrides so only the file contents are under test
+        for var in (
+            "MCP_SERVER_NAME",
+            "LOG_LEVEL",
+            "LOG_FILE",
+            "QDRANT_HOST",
+            "QDRANT_PORT",
+            "QDRANT_API_KEY",
+            "EMBEDDING_MODEL",
+            "EMBEDDING_DEVICE",
+        ):
+            monkeypatch.delenv(var, raising=False)
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "server:\n"
+            "  name: yaml-server\n"
+            "logging:\n"
+            "  level: WARNING\n"
+            "qdrant:\n"
+            "  host: yaml-host\n"
+            "  port: 6400\n",
+            encoding="utf-8",
+        )
+
+        config = ConfigManager(config_file).config
+        assert config.name == "yaml-server"
+        assert config.log_level is LogLevel.WARNING
+        assert config.qdrant.host == "yaml-host"
+        assert config.qdrant.port == 6400
+        # Untouched settings keep their defaults
+        assert config.embedding.model_name == "all-MiniLM-L6-v2"